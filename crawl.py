@@ -1,7 +1,13 @@
+import os
+import threading
+
+import imagehash
+from PIL import Image
 from icrawler.builtin import GoogleImageCrawler, BingImageCrawler, BaiduImageCrawler
 
 keyword = "ghs hazard labels 2.3 toxic gases"
 data_dir = "data\\2.3_toxic_gases"
+max_num = 1000
 
 google_crawler = GoogleImageCrawler(
     feeder_threads=1,
@@ -15,20 +21,70 @@ filters = dict(
     license="commercial,modify",
     date=((2017, 1, 1), (2017, 11, 30)),
 )
-google_crawler.crawl(
-    keyword=keyword,
-    filters=filters,
-    offset=0,
-    max_num=1000,
-    min_size=(200, 200),
-    max_size=None,
-    file_idx_offset=0,
-)
 
 bing_crawler = BingImageCrawler(downloader_threads=4, storage={"root_dir": data_dir})
-bing_crawler.crawl(keyword=keyword, filters=None, offset=0, max_num=1000)
 
 baidu_crawler = BaiduImageCrawler(storage={"root_dir": data_dir})
-baidu_crawler.crawl(
-    keyword=keyword, offset=0, max_num=1000, min_size=(200, 200), max_size=None
-)
+
+# Each crawler owns its own thread pool, so they can run side by side.
+# Separate file index ranges keep them from overwriting each other's files.
+crawls = [
+    threading.Thread(
+        target=google_crawler.crawl,
+        kwargs=dict(
+            keyword=keyword,
+            filters=filters,
+            offset=0,
+            max_num=max_num,
+            min_size=(200, 200),
+            max_size=None,
+            file_idx_offset=0,
+        ),
+    ),
+    threading.Thread(
+        target=bing_crawler.crawl,
+        kwargs=dict(
+            keyword=keyword,
+            filters=None,
+            offset=0,
+            max_num=max_num,
+            file_idx_offset=max_num,
+        ),
+    ),
+    threading.Thread(
+        target=baidu_crawler.crawl,
+        kwargs=dict(
+            keyword=keyword,
+            offset=0,
+            max_num=max_num,
+            min_size=(200, 200),
+            max_size=None,
+            file_idx_offset=2 * max_num,
+        ),
+    ),
+]
+
+for crawl in crawls:
+    crawl.start()
+for crawl in crawls:
+    crawl.join()
+
+# Remove images that more than one search engine returned
+seen_hashes = set()
+removed = 0
+for filename in sorted(os.listdir(data_dir)):
+    path = os.path.join(data_dir, filename)
+    try:
+        with Image.open(path) as image:
+            image_hash = imagehash.phash(image)
+    except Exception as e:
+        print(f"Skipping unreadable file {path}: {e}")
+        continue
+
+    if image_hash in seen_hashes:
+        os.remove(path)
+        removed += 1
+    else:
+        seen_hashes.add(image_hash)
+
+print(f"Kept {len(seen_hashes)} images, removed {removed} duplicates")
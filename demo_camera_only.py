@@ -3,12 +3,93 @@ import supervision as sv
 from ultralytics import YOLO
 import time
 import numpy as np
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import torch
+except ImportError:
+    torch = None
 
 # Configuration
 CONFIDENCE_THRESHOLD = 0.5
+WINDOW_NAME = "YOLOv8 Detection"
 RESOLUTION_PRESETS = {"HD": (1280, 720), "Full HD": (1920, 1080), "SD": (640, 480)}
 
 
+if numba is not None:
+
+    # Fused grayscale: read BGR once, write replicated luma once
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def bgr_to_gray_bgr(src, dst):
+        for y in numba.prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                luma = 0.114 * src[y, x, 0] + 0.587 * src[y, x, 1] + 0.299 * src[y, x, 2]
+                value = np.uint8(luma + 0.5)
+                dst[y, x, 0] = value
+                dst[y, x, 1] = value
+                dst[y, x, 2] = value
+
+
+# Draws detection boxes on a CUDA copy of the frame, next to the model outputs
+class GPUBoxRenderer:
+    def __init__(self, box_annotator, thickness=2):
+        self.box_annotator = box_annotator
+        self.thickness = thickness
+        self._frame_gpu = None
+        self._frame_pinned = None
+        self._colors = {}
+
+    @staticmethod
+    def is_available():
+        return torch is not None and torch.cuda.is_available()
+
+    def _color(self, class_id):
+        # Match the colors the CPU annotators pick for each class
+        if class_id not in self._colors:
+            try:
+                bgr = self.box_annotator.color.by_idx(class_id).as_bgr()
+            except Exception:
+                bgr = (0, 0, 255)
+            self._colors[class_id] = torch.tensor(
+                bgr, dtype=torch.uint8, device="cuda"
+            )
+        return self._colors[class_id]
+
+    def annotate(self, frame, result):
+        if self._frame_gpu is None or self._frame_gpu.shape != frame.shape:
+            self._frame_pinned = torch.empty(frame.shape, dtype=torch.uint8).pin_memory()
+            self._frame_gpu = torch.empty(frame.shape, dtype=torch.uint8, device="cuda")
+
+        np.copyto(self._frame_pinned.numpy(), frame)
+        self._frame_gpu.copy_(self._frame_pinned, non_blocking=True)
+
+        height, width = frame.shape[:2]
+        t = self.thickness
+        boxes = result.boxes.xyxy.round().int()
+        boxes[:, 0::2] = boxes[:, 0::2].clamp(0, width)
+        boxes[:, 1::2] = boxes[:, 1::2].clamp(0, height)
+
+        # Box edges are slice fills on the device tensor, no per-pixel CPU work
+        for (x1, y1, x2, y2), class_id in zip(
+            boxes.tolist(), result.boxes.cls.int().tolist()
+        ):
+            color = self._color(class_id)
+            self._frame_gpu[y1 : y1 + t, x1:x2] = color
+            self._frame_gpu[max(y1, y2 - t) : y2, x1:x2] = color
+            self._frame_gpu[y1:y2, x1 : x1 + t] = color
+            self._frame_gpu[y1:y2, max(x1, x2 - t) : x2] = color
+
+        # Single device-to-host copy of the finished image into the pinned buffer
+        self._frame_pinned.copy_(self._frame_gpu)
+        return self._frame_pinned.numpy()
+
+
 class CameraManager:
     def __init__(self):
         self.available_cameras = self.get_available_cameras()
@@ -18,13 +99,18 @@ class CameraManager:
         self.contrast = 100
 
     def get_available_cameras(self):
-        cameras = []
-        for i in range(5):  # Check first 5 camera indices
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                cameras.append(i)
-                cap.release()
-        return cameras
+        # Probe the first 5 camera indices in parallel, each open blocks on the driver
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = executor.map(self._probe_camera, range(5))
+        return [i for i in results if i is not None]
+
+    @staticmethod
+    def _probe_camera(index):
+        cap = cv2.VideoCapture(index)
+        try:
+            return index if cap.isOpened() else None
+        finally:
+            cap.release()
 
     def switch_camera(self):
         self.current_camera = (self.current_camera + 1) % len(self.available_cameras)
@@ -32,16 +118,46 @@ class CameraManager:
 
 
 class UI:
+    STATUS_BAR_HEIGHT = 100
+    CONTROLS_WIDTH = 200
+    CONTROLS = [
+        "Q/ESC: Quit",
+        "C: Switch Camera",
+        "F: Toggle FPS",
+        "H: Hide Controls",
+        "E: Enhanced Mode",
+        "G: Grayscale Mode",
+    ]
+
     def __init__(self):
         self.show_fps = True
         self.show_controls = True
         self.filter_mode = 0  # 0: None, 1: Enhance, 2: Grayscale
+        self._status_bar_black = None  # Cached black rows matching the bar region
+        self._controls_sprite = self._render_controls_sprite()
+        self._gray_buffer = None  # Reused grayscale output, one per resolution
+
+    def _render_controls_sprite(self):
+        height = 30 + len(self.CONTROLS) * 20
+        sprite = np.zeros((height, self.CONTROLS_WIDTH, 4), np.uint8)
+        for i, control in enumerate(self.CONTROLS):
+            cv2.putText(
+                sprite,
+                control,
+                (0, 30 + i * 20),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.4,
+                (255, 255, 255, 255),
+                1,
+            )
+        return sprite
 
     def draw_status_bar(self, frame, fps, camera_id, detection_count):
-        # Draw semi-transparent status bar
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (frame.shape[1], 100), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+        # Darken only the status bar rows in place instead of blending the whole frame
+        roi = frame[: self.STATUS_BAR_HEIGHT]
+        if self._status_bar_black is None or self._status_bar_black.shape != roi.shape:
+            self._status_bar_black = np.zeros_like(roi)
+        cv2.addWeighted(self._status_bar_black, 0.3, roi, 0.7, 0, dst=roi)
 
         # Add status information
         cv2.putText(
@@ -72,48 +188,45 @@ class UI:
             2,
         )
 
-        # Draw controls help
+        # Draw controls help by blitting the pre-rendered sprite
         if self.show_controls:
-            controls = [
-                "Q/ESC: Quit",
-                "C: Switch Camera",
-                "F: Toggle FPS",
-                "H: Hide Controls",
-                "E: Enhanced Mode",
-                "G: Grayscale Mode",
-            ]
-            for i, control in enumerate(controls):
-                cv2.putText(
-                    frame,
-                    control,
-                    (frame.shape[1] - 200, 30 + i * 20),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.4,
-                    (255, 255, 255),
-                    1,
-                )
+            self._blit_controls(frame)
+
+    def _blit_controls(self, frame):
+        x = frame.shape[1] - self.CONTROLS_WIDTH
+        sprite = self._controls_sprite[: frame.shape[0], max(0, -x) :]
+        region = frame[: sprite.shape[0], max(0, x) : max(0, x) + sprite.shape[1]]
+        np.copyto(region, sprite[..., :3], where=sprite[..., 3:] > 0)
 
     def process_frame(self, frame):
         if self.filter_mode == 1:  # Enhanced mode
             frame = cv2.detailEnhance(frame, sigma_s=10, sigma_r=0.15)
         elif self.filter_mode == 2:  # Grayscale
-            frame = cv2.cvtColor(
-                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR
-            )
+            if numba is not None:
+                if self._gray_buffer is None or self._gray_buffer.shape != frame.shape:
+                    self._gray_buffer = np.empty_like(frame)
+                bgr_to_gray_bgr(frame, self._gray_buffer)
+                frame = self._gray_buffer
+            else:
+                frame = cv2.cvtColor(
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR
+                )
         return frame
 
 
 # FPS counter class
 class FPS:
     def __init__(self):
-        self.ptime = 0
+        self.ptime_ns = 0
+        self.fps = 0
 
     def update(self, img):
-        ctime = time.time()
-        fps = 1 / (ctime - self.ptime) if self.ptime != 0 else 0
-        self.ptime = ctime
+        ctime_ns = time.perf_counter_ns()
+        dt = ctime_ns - self.ptime_ns
+        self.fps = 1_000_000_000 // dt if self.ptime_ns and dt else 0
+        self.ptime_ns = ctime_ns
         cv2.putText(
-            img, f"FPS: {int(fps)}", (20, 70), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 2
+            img, f"FPS: {self.fps}", (20, 70), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 2
         )
         return img
 
@@ -121,9 +234,19 @@ class FPS:
 # Load YOLO model
 model = YOLO(r"D:\Github\hazard-label-dataset\yolo12.pt")
 
+
+# Labels repeat frame to frame, so cache them by class and confidence percent
+@lru_cache(maxsize=512)
+def format_label(class_id, confidence_pct):
+    return f"{model.model.names[class_id]} {confidence_pct / 100:0.2f}"
+
+
 # Initialize annotators with correct settings
 box_annotator = sv.BoxAnnotator(thickness=2)
 label_annotator = sv.LabelAnnotator()
+gpu_box_renderer = (
+    GPUBoxRenderer(box_annotator) if GPUBoxRenderer.is_available() else None
+)
 
 # Initialize custom FPS counter
 fps_counter = FPS()
@@ -135,13 +258,23 @@ ui = UI()
 try:
     cap = cv2.VideoCapture(camera_manager.current_camera)
 
+    # Create the window once, with GPU texture upload when OpenCV has OpenGL
+    try:
+        cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+    except cv2.error:
+        cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
+
+    frame_index = 0
+    capture_buffer = None  # Reused by cap.read while the resolution is unchanged
     while True:
-        ret, frame = cap.read()
+        ret, frame = cap.read(capture_buffer)
         if not ret:
             print("Can't receive frame. Switching cameras...")
             new_camera = camera_manager.switch_camera()
             cap = cv2.VideoCapture(new_camera)
+            capture_buffer = None
             continue
+        capture_buffer = frame
 
         # Process frame with selected filter
         frame = ui.process_frame(frame)
@@ -151,14 +284,21 @@ try:
         detections = sv.Detections.from_ultralytics(result)
 
         # Draw bounding boxes and labels with confidence scores
+        confidence_pcts = np.rint(detections.confidence * 100).astype(int)
         labels = [
-            f"{model.model.names[class_id]} {confidence:0.2f}"
-            for _, confidence, class_id, _ in detections
+            format_label(class_id, confidence_pct)
+            for class_id, confidence_pct in zip(
+                detections.class_id.tolist(), confidence_pcts.tolist()
+            )
         ]
 
-        annotated_image = box_annotator.annotate(
-            scene=frame.copy(), detections=detections
-        )
+        # Draw boxes on the GPU when possible, otherwise in place on the CPU frame
+        if gpu_box_renderer is not None:
+            annotated_image = gpu_box_renderer.annotate(frame, result)
+        else:
+            annotated_image = box_annotator.annotate(
+                scene=frame, detections=detections
+            )
         annotated_image = label_annotator.annotate(
             scene=annotated_image, detections=detections, labels=labels
         )
@@ -166,20 +306,24 @@ try:
         # Update FPS counter
         annotated_image = fps_counter.update(annotated_image)
 
-        # Update UI
-        ctime = time.time()
-        fps = 1 / (ctime - fps_counter.ptime) if fps_counter.ptime != 0 else 0
-        fps_counter.ptime = ctime
-
+        # Update UI, reusing the FPS measured above
         ui.draw_status_bar(
-            annotated_image, fps, camera_manager.current_camera, len(detections)
+            annotated_image,
+            fps_counter.fps,
+            camera_manager.current_camera,
+            len(detections),
         )
 
         # Show frame
-        cv2.imshow("YOLOv8 Detection", annotated_image)
+        cv2.imshow(WINDOW_NAME, annotated_image)
 
         # Handle keyboard input
-        key = cv2.waitKey(1) & 0xFF
+        # Run the full message pump every other frame, just poll in between
+        frame_index += 1
+        if frame_index % 2 == 0 or not hasattr(cv2, "pollKey"):
+            key = cv2.waitKey(1) & 0xFF
+        else:
+            key = cv2.pollKey() & 0xFF
         if key in [ord("q"), 27]:  # q or ESC
             break
         elif key == ord("c"):  # Switch camera
@@ -1,18 +1,66 @@
 import os
 import sys
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 from pathlib import Path
 
 
-def download_file(url, filename):
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+REQUEST_TIMEOUT = (5, 60)  # (connect, read) seconds
+
+# Shared session so repeated downloads reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+# Model weights are already compressed, don't spend CPU decoding a gzip layer
+SESSION.headers.update({"Accept-Encoding": "identity"})
+
+
+def hash_path(filename):
+    """
+    Path of the SHA256 sidecar file recorded after a successful download
+    """
+    return filename + ".sha256"
+
+
+def file_sha256(filename):
+    """
+    Compute the SHA256 hex digest of a file, reading it in large chunks
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_verified(filename):
+    """
+    Check whether a file matches the hash recorded when it was downloaded
+    """
+    if not os.path.exists(filename) or not os.path.exists(hash_path(filename)):
+        return False
+
+    with open(hash_path(filename)) as f:
+        expected = f.read().strip()
+    return file_sha256(filename) == expected
+
+
+def download_file(url, filename, session=None):
     """
     Download a file from a URL with a progress bar
     """
     # Create models directory if it doesn't exist
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    response = requests.get(url, stream=True)
+    session = session or SESSION
+    response = session.get(url, stream=True, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
     total_size = int(response.headers.get("content-length", 0))
 
     # Show download progress
@@ -23,18 +71,26 @@ def download_file(url, filename):
         desc=f"Downloading {os.path.basename(filename)}",
     )
 
-    # Write file
-    with open(filename, "wb") as file:
-        for data in response.iter_content(chunk_size=1024):
+    # Write to a partial file and hash while streaming
+    digest = hashlib.sha256()
+    partial_filename = filename + ".part"
+    with open(partial_filename, "wb") as file:
+        for data in response.iter_content(chunk_size=CHUNK_SIZE):
             progress_bar.update(len(data))
+            digest.update(data)
             file.write(data)
 
     progress_bar.close()
 
     if total_size != 0 and progress_bar.n != total_size:
         print("ERROR: Download failed")
+        os.remove(partial_filename)
         return False
 
+    os.replace(partial_filename, filename)
+    with open(hash_path(filename), "w") as f:
+        f.write(digest.hexdigest())
+
     return True
 
 
@@ -52,6 +108,10 @@ def main():
     )
     print(f"The model will be saved to: {model_path}")
 
+    if is_verified(model_path):
+        print("Model already downloaded and verified, skipping download.")
+        return
+
     if os.path.exists(model_path):
         overwrite = input(f"Model already exists at {model_path}. Overwrite? (y/n): ")
         if overwrite.lower() != "y":
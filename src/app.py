@@ -1,7 +1,7 @@
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 from app.views.main_window import MainWindow
 from app.controllers.app_controller import AppController
 from app.models.detection_model import DetectionModel
@@ -12,6 +12,9 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("GHS Hazard Label Detector")
 
+    # Room for scaled frames to be shown again without rescaling them (in KB)
+    QPixmapCache.setCacheLimit(65536)
+
     # Set application icon
     icon_path = os.path.join(
         os.path.dirname(__file__), "app", "resources", "icons", "app_icon.png"
@@ -4,10 +4,20 @@ import os
 import numpy as np
 import pandas as pd
 import logging
-from PyQt6.QtCore import QObject, QTimer
+from pathlib import Path
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
 from datetime import datetime
 from ..models.camera_model import CameraModel, CameraBackend
-from ..models.detection_model import DetectionModel, DetectionResult
+from ..models.detection_model import DetectionModel, DetectionResult, DetectionThread
+from ..models.video_model import VideoWorker
 from ..views.main_window import MainWindow
 from ..utils.model_utils import ModelManager
 from ..utils.compatibility import log_dependency_versions
@@ -22,14 +32,76 @@ logging.basicConfig(
 logger = logging.getLogger("AppController")
 
 
+class ModelScanTask(QRunnable):
+    """Scans the models directory on the thread pool"""
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def run(self):
+        """Run the scan and hand the result back"""
+        self.callback(ModelManager.get_available_models())
+
+
+class ModelExportTask(QRunnable):
+    """Exports a model for the fastest local backend on the thread pool"""
+
+    def __init__(self, model_path, callback):
+        super().__init__()
+        self.model_path = model_path
+        self.callback = callback
+
+    def run(self):
+        """Run the export and hand back its path, None if it failed"""
+        try:
+            export_path = ModelManager.export_optimized_model(self.model_path)
+        except Exception as e:
+            logger.error(f"Error exporting model: {str(e)}")
+            export_path = None
+        self.callback(self.model_path, export_path)
+
+
+class ScreenshotTask(QRunnable):
+    """Encodes and writes a screenshot on the thread pool"""
+
+    def __init__(self, frame, filename, callback):
+        super().__init__()
+        self.frame = frame
+        self.filename = filename
+        self.callback = callback
+
+    def run(self):
+        """Convert the RGB frame to BGR, save it and report the outcome"""
+        try:
+            frame_bgr = cv2.cvtColor(self.frame, cv2.COLOR_RGB2BGR)
+            saved = cv2.imwrite(self.filename, frame_bgr)
+        except Exception as e:
+            logger.error(f"Error saving screenshot: {str(e)}")
+            saved = False
+        self.callback(self.filename, saved)
+
+
 class AppController(QObject):
     """Main application controller that connects models and views"""
 
+    model_export_status = pyqtSignal(str)  # Progress message while exporting a model
+    model_exported = pyqtSignal(str, object)  # (.pt path, export path or None)
+    models_scanned = pyqtSignal(list)  # Model list from a background scan
+    screenshot_saved = pyqtSignal(str, bool)  # (file name, success) from the pool
+
+    RENDER_INTERVAL_MS = 33  # Drain detection results at ~30Hz
+    NS_PER_SECOND = 1_000_000_000
+    TABLE_UPDATE_INTERVAL_NS = 200_000_000  # Update the table at most at ~5Hz
+    TABLE_REFRESH_INTERVAL_NS = 1_000_000_000  # Refresh unchanged tables at ~1Hz
+    VIDEO_STOP_WAIT_MS = 2000  # Wait for a stopped video worker before retiring it
+
     def __init__(self, model=None, view=None):
         super().__init__()
 
-        # Log dependency versions to help with troubleshooting
-        log_dependency_versions()
+        # Log dependency versions to help with troubleshooting, once the
+        # event loop is running so the metadata lookups don't delay the window
+        QTimer.singleShot(0, log_dependency_versions)
 
         # Initialize models
         self.detection_model = model if model else DetectionModel()
@@ -41,11 +113,39 @@ class AppController(QObject):
         # State management
         self.detection_enabled = True
         self.tracking_enabled = True
-        self.processing_frame = False
         self.frame_count = 0
         self.fps = 0
-        self.last_fps_update = time.time()
-        self.output_dir = "output"
+        self.last_fps_update_ns = time.monotonic_ns()
+        self.output_dir = Path("output")
+        self.video_output_dir = self.output_dir / "predictions" / "videos"
+
+        # Create output folders once instead of checking on every save
+        os.makedirs(self.output_dir, exist_ok=True)
+        os.makedirs(self.video_output_dir, exist_ok=True)
+        self.video_stride = 1  # Process every Nth video frame
+        self._last_table_signature = None
+        self._last_table_update_ns = 0
+        self._last_detections = None  # Most recent sv.Detections, used for export
+        self.video_worker = None
+        self.video_thread = None
+        self._retired_video_threads = {}  # Stopped QThread -> worker, until it exits
+        self._exports_running = set()  # .pt paths exported on the thread pool
+        self._failed_exports = set()  # (.pt path, mtime) whose export failed
+
+        # Run detection on a worker thread, render results on the UI thread.
+        # Frames that queue up during a forward pass share the next one, engines
+        # exported for a smaller batch fall back to frame by frame passes
+        self.detection_thread = DetectionThread(
+            self.detection_model, ModelManager.ENGINE_BATCH_SIZE
+        )
+        self.detection_thread.start()
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self._render_detection_result)
+        self.render_timer.start(self.RENDER_INTERVAL_MS)
+
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.shutdown)
 
         # Connect signals from view
         self._connect_view_signals()
@@ -58,11 +158,9 @@ class AppController(QObject):
             self.camera_model.get_available_cameras()
         )
 
-        # Set up model list in view
-        self.refresh_models()
-
-        # Auto-load YOLOv8 model
-        QTimer.singleShot(500, self._auto_load_yolov8_model)
+        # Scan for models off the UI thread, then auto-load a YOLOv8 model
+        self._auto_load_pending = True
+        self.refresh_models_async()
 
     def _connect_view_signals(self):
         """Connect signals from the view to controller methods"""
@@ -91,7 +189,9 @@ class AppController(QObject):
 
         # Connect model selection signals
         self.view.controls_panel.model_selected.connect(self.load_model)
-        self.view.controls_panel.refresh_models_clicked.connect(self.refresh_models)
+        self.view.controls_panel.refresh_models_clicked.connect(
+            self.refresh_models_async
+        )
 
         # Connect image processing signals
         self.view.controls_panel.image_panel.processing_requested.connect(
@@ -104,11 +204,22 @@ class AppController(QObject):
         self.view.controls_panel.video_panel.playback_stopped.connect(
             self._on_video_stop
         )
+        self.view.controls_panel.video_panel.stride_changed.connect(
+            self.set_video_stride
+        )
 
     def _connect_model_signals(self):
         """Connect signals from models to controller methods"""
         # Camera model signals
-        self.camera_model.frame_captured.connect(self.process_frame)
+        self.camera_model.frame_captured.connect(
+            self.process_frame, Qt.ConnectionType.QueuedConnection
+        )
+        self.camera_model.preview_captured.connect(
+            self.show_preview, Qt.ConnectionType.QueuedConnection
+        )
+        self.view.unified_display.display_resized.connect(
+            self.camera_model.set_preview_size
+        )
         self.camera_model.camera_error.connect(self.handle_camera_error)
         self.camera_model.camera_status.connect(self.handle_camera_status)
         self.camera_model.camera_connected.connect(self.handle_camera_connection)
@@ -117,6 +228,16 @@ class AppController(QObject):
             self.handle_camera_progress
         )  # Add this line
 
+        # Model export progress and background exports finishing
+        self.model_export_status.connect(self.handle_model_export_status)
+        self.model_exported.connect(self.handle_model_exported)
+
+        # Background model directory scans
+        self.models_scanned.connect(self.handle_models_scanned)
+
+        # Screenshots encoded on the thread pool
+        self.screenshot_saved.connect(self.handle_screenshot_saved)
+
     def handle_camera_error(self, error_message):
         """Handle camera error messages"""
         logger.error(f"Camera error: {error_message}")
@@ -139,6 +260,11 @@ class AppController(QObject):
         """Handle camera initialization progress updates"""
         self.view.controls_panel.set_progress(progress_value)
 
+    def handle_model_export_status(self, status_message):
+        """Show model export progress"""
+        logger.info(f"Model export: {status_message}")
+        self.view.status_model.setText(f"Model: {status_message}")
+
     def _load_default_model(self):
         """
         Don't load a default model automatically, just update the UI
@@ -152,17 +278,31 @@ class AppController(QObject):
     def refresh_models(self):
         """Refresh the list of available models"""
         models = self.detection_model.refresh_available_models()
+        return self._show_model_list(models)
+
+    def refresh_models_async(self):
+        """Refresh the list of available models without blocking the UI"""
+        QThreadPool.globalInstance().start(ModelScanTask(self.models_scanned.emit))
 
-        # Sort models by filename to ensure consistent order
-        models.sort(key=lambda x: x[1].lower())
+    def handle_models_scanned(self, models):
+        """Handle a model list delivered by a background scan"""
+        self.detection_model.available_models = models
+        self._show_model_list(models)
 
-        # Update the view with sorted models
+        # The first scan after startup picks the model to auto-load
+        if self._auto_load_pending:
+            self._auto_load_pending = False
+            self._auto_load_yolov8_model()
+
+    def _show_model_list(self, models):
+        """Show the model list in the view"""
+        # ModelManager already returns the models sorted by filename
         self.view.controls_panel.set_model_list(models)
 
-        # Log the found models
-        logger.info(f"Found {len(models)} model(s).")
-        for path, name in models:
-            logger.info(f"Model: {name} at {path}")
+        # Log the found models in one lazily formatted line
+        logger.info(
+            "Found %d model(s): %s", len(models), ", ".join(n for _, n in models)
+        )
 
         return models
 
@@ -208,8 +348,11 @@ class AppController(QObject):
     def stop_camera(self):
         """Stop camera capture and clear all views"""
         self.camera_model.stop_camera()
+        self.detection_thread.clear()
         self.view.unified_display.clear()  # Use unified_display instead of camera_view
         self.view.results_table.clear()  # Clear detection results
+        self._last_table_signature = None
+        self._last_detections = None
         self.view.update_status(0, 0)  # Reset status bar
         self.frame_count = 0  # Reset frame counter
         self.fps = 0  # Reset FPS counter
@@ -224,58 +367,99 @@ class AppController(QObject):
 
     def process_frame(self, frame):
         """Process a frame from the camera"""
-        if self.processing_frame:
-            return
+        if self.detection_enabled and self.detection_model.model:
+            # Hand the frame to the detection thread, results are rendered by timer
+            self.detection_thread.submit_frame(frame)
+        elif self.camera_model.preview_size is None:
+            # Just display the frame without detection
+            self._show_raw_frame(frame)
+
+    def show_preview(self, preview):
+        """Display a downscaled camera frame while detection is off"""
+        if not (self.detection_enabled and self.detection_model.model):
+            self._show_raw_frame(preview)
 
-        self.processing_frame = True
+    def _show_raw_frame(self, frame):
+        """Display a camera frame without detection"""
+        self._update_fps()
+        self.view.unified_display.update_frame(frame, False)
+        self.view.update_status(self.fps, 0)
 
-        # Update frame count and calculate FPS
+    def _update_fps(self):
+        """Update frame count and calculate FPS"""
         self.frame_count += 1
-        current_time = time.time()
-        elapsed = current_time - self.last_fps_update
+        current_time_ns = time.monotonic_ns()
+        elapsed_ns = current_time_ns - self.last_fps_update_ns
 
-        if elapsed >= 1.0:  # Update FPS once per second
-            self.fps = self.frame_count / elapsed
+        if elapsed_ns >= self.NS_PER_SECOND:  # Update FPS once per second
+            self.fps = self.frame_count * self.NS_PER_SECOND // elapsed_ns
             self.frame_count = 0
-            self.last_fps_update = current_time
+            self.last_fps_update_ns = current_time_ns
 
-        if self.detection_enabled and self.detection_model.model:
-            try:
-                # Process frame with tracking enabled
-                result = self.detection_model.detect(frame, is_video=True)
-
-                # Show the frame in camera mode
-                self.view.unified_display.set_mode("camera")
-                if result.annotated_frame is not None:
-                    self.view.unified_display.update_frame(result.annotated_frame, True)
-                else:
-                    self.view.unified_display.update_frame(frame, False)
-
-                # Update results table and detection count
-                if result.detections is not None:
-                    self.view.update_results_table(
-                        result.detections, self.detection_model.class_names
-                    )
+    def _render_detection_result(self):
+        """Display the newest result produced by the detection thread"""
+        result = self.detection_thread.get_result()
+        if result is None:
+            return
 
-                    # Update detection count in unified display
-                    num_objects = len(result.detections) if result.detections else 0
-                    self.view.unified_display.update_detection_count(num_objects)
+        self._update_fps()
 
-                    # Update status bar
-                    self.view.update_status(self.fps, num_objects)
-                else:
-                    self.view.unified_display.update_detection_count(0)
-                    self.view.update_status(self.fps, 0)
-            except Exception as e:
-                logger.error(f"Error during frame processing: {str(e)}")
-                self.view.unified_display.update_frame(frame, False)
-                self.view.update_status(self.fps, 0)
-        else:
-            # Just display the frame without detection
-            self.view.unified_display.update_frame(frame, False)
+        try:
+            # Show the frame in camera mode
+            self.view.unified_display.set_mode("camera")
+            if result.annotated_frame is not None:
+                self.view.unified_display.update_frame(result.annotated_frame, True)
+            else:
+                self.view.unified_display.update_frame(result.frame, False)
+
+            # Update results table, an empty result still clears stale rows
+            detections = result.detections
+            num_objects = 0 if detections is None else len(detections)
+            if detections is not None:
+                self._update_results_table(detections)
+
+            # Update detection count in unified display and status bar
+            self.view.unified_display.update_detection_count(num_objects)
+            self.view.update_status(self.fps, num_objects)
+        except Exception as e:
+            logger.error(f"Error during frame processing: {str(e)}")
+            self.view.unified_display.update_frame(result.frame, False)
             self.view.update_status(self.fps, 0)
 
-        self.processing_frame = False
+    def _update_results_table(self, detections):
+        """Update the results table at ~5Hz when objects change, else at ~1Hz"""
+        self._last_detections = detections
+        tracker_ids = detections.tracker_id
+        class_ids = detections.class_id
+        if tracker_ids is not None and class_ids is not None:
+            signature = tuple(sorted(zip(tracker_ids.tolist(), class_ids.tolist())))
+        elif tracker_ids is not None:
+            signature = tuple(sorted(tracker_ids.tolist()))
+        elif class_ids is not None:
+            signature = tuple(class_ids.tolist())
+        else:
+            signature = len(detections)
+
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_table_update_ns
+        if signature == self._last_table_signature:
+            if elapsed_ns < self.TABLE_REFRESH_INTERVAL_NS:
+                return
+        elif elapsed_ns < self.TABLE_UPDATE_INTERVAL_NS:
+            return
+
+        self._last_table_signature = signature
+        self._last_table_update_ns = now_ns
+        self.view.update_results_table(detections, self.detection_model.class_names)
+
+    def shutdown(self):
+        """Stop background threads before the application exits"""
+        self.render_timer.stop()
+        self._stop_video_worker()
+        for thread in list(self._retired_video_threads):
+            thread.wait()
+        self.camera_model.stop_camera()
+        self.detection_thread.stop()
 
     def toggle_detection(self, enabled):
         """Toggle detection processing"""
@@ -293,11 +477,26 @@ class AppController(QObject):
         """Set IoU threshold"""
         self.detection_model.set_iou_threshold(value)
 
+    def set_video_stride(self, stride):
+        """Set how many video frames to advance per processed frame"""
+        self.video_stride = max(1, int(stride))
+
     def load_model(self, model_path):
         """Load a YOLO model from file"""
         try:
             logger.info(f"Loading model: {model_path}")
-            model_loaded = self.detection_model.load_model(model_path)
+            model_loaded = False
+
+            # Prefer a current export, falling back to the .pt checkpoint
+            export_path = self._get_export_for_model(model_path)
+            if export_path:
+                model_loaded = self.detection_model.load_model(export_path)
+                if not model_loaded:
+                    logger.warning(
+                        f"Failed to load exported model, falling back to {model_path}"
+                    )
+            if not model_loaded:
+                model_loaded = self.detection_model.load_model(model_path)
             if model_loaded:
                 model_name = os.path.basename(model_path)
                 self.view.update_status(self.fps, 0, model_name)
@@ -305,59 +504,124 @@ class AppController(QObject):
 
                 # Update selected model in view
                 self.view.controls_panel.set_current_model(model_path)
+
+                # Build a missing export while the checkpoint serves detection
+                if not export_path:
+                    self._start_model_export(model_path)
             else:
                 self.view.show_error(f"Failed to load model from {model_path}")
         except Exception as e:
             self.view.show_error(f"Error loading model: {str(e)}")
 
+    def _get_export_for_model(self, model_path):
+        """Get a current TensorRT or OpenVINO export of the model, if there is one"""
+        if not self.detection_model.use_fp16 or not model_path.endswith(".pt"):
+            return None
+
+        export_path = ModelManager.get_export_path(model_path)
+        if export_path and ModelManager.is_export_current(model_path, export_path):
+            return export_path
+        return None
+
+    def _start_model_export(self, model_path):
+        """Export a model on the thread pool, unless it is running or failed before"""
+        if not self.detection_model.use_fp16 or not model_path.endswith(".pt"):
+            return
+        export_path = ModelManager.get_export_path(model_path)
+        if not export_path or model_path in self._exports_running:
+            return
+        if self._export_key(model_path) in self._failed_exports:
+            return
+
+        backend = "TensorRT" if export_path.endswith(".engine") else "OpenVINO"
+        self.model_export_status.emit(f"Exporting {backend} model in the background...")
+        self._exports_running.add(model_path)
+        QThreadPool.globalInstance().start(
+            ModelExportTask(model_path, self.model_exported.emit)
+        )
+
+    @staticmethod
+    def _export_key(model_path):
+        """Key a failed export by checkpoint and mtime, so new weights retry it"""
+        try:
+            return model_path, os.stat(model_path).st_mtime_ns
+        except OSError:
+            return model_path, None
+
+    def handle_model_exported(self, model_path, export_path):
+        """Switch to a finished export if its checkpoint is still the loaded model"""
+        self._exports_running.discard(model_path)
+        model_name = os.path.basename(model_path)
+        if not export_path:
+            self._failed_exports.add(self._export_key(model_path))
+            logger.warning(f"Export failed, keeping {model_path}")
+            if self.detection_model.model_path == model_path:
+                self.view.status_model.setText(f"Model: {model_name}")
+            return
+
+        # Another model was loaded while this one was exporting
+        if self.detection_model.model_path != model_path:
+            return
+
+        if self.detection_model.load_model(export_path):
+            logger.info(f"Switched to exported model {export_path}")
+        else:
+            logger.warning(f"Failed to load exported model, keeping {model_path}")
+            self._failed_exports.add(self._export_key(model_path))
+            self.detection_model.load_model(model_path)
+        self.view.status_model.setText(f"Model: {model_name}")
+
     def take_screenshot(self):
         """Take a screenshot of the current frame"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(self.output_dir, f"screenshot_{timestamp}.jpg")
-
-        # Get current frame from unified display
-        if self.view.unified_display.processed_frame is not None:
-            frame = cv2.cvtColor(
-                self.view.unified_display.processed_frame, cv2.COLOR_RGB2BGR
+        filename = str(self.output_dir / f"screenshot_{timestamp}.jpg")
+
+        # The display replaces its stored frame on every update rather than
+        # writing into it, so the task can hold this one without copying
+        processed_frame = self.view.unified_display.processed_frame
+        if processed_frame is not None:
+            QThreadPool.globalInstance().start(
+                ScreenshotTask(processed_frame, filename, self.screenshot_saved.emit)
             )
-            cv2.imwrite(filename, frame)
-            self.view.show_info(f"Screenshot saved as {filename}")
         else:
             self.view.show_error("No frame available")
 
+    def handle_screenshot_saved(self, filename, saved):
+        """Report a screenshot written by the thread pool"""
+        if saved:
+            self.view.show_info(f"Screenshot saved as {filename}")
+        else:
+            self.view.show_error(f"Could not save screenshot {filename}")
+
     def export_results(self):
         """Export detection results to CSV"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        # One timestamp for the file name and every exported row
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        export_time = now.strftime("%Y-%m-%d %H:%M:%S")
+        filename = str(self.output_dir / f"detections_{timestamp}.csv")
+
+        # Build columns straight from the cached detection arrays
+        detections = self._last_detections
+        if self.detection_model.model and detections is not None and len(detections):
+            df = self._detections_to_dataframe(detections, export_time)
+            df.to_csv(filename, index=False)
+            self.view.show_info(f"Detection results exported to {filename}")
+            return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(self.output_dir, f"detections_{timestamp}.csv")
-
-        # Get current detections
-        if (
-            self.detection_model.model
-            and hasattr(self.view.results_table, "table")
-            and self.view.results_table.table.rowCount() > 0
-        ):  # Fixed: Changed curly brace to parenthesis
+        # Fall back to the rows shown in the table model
+        table_rows = self.view.results_table.get_rows()
+        if self.detection_model.model and table_rows:
             rows = []
-            for row in range(self.view.results_table.table.rowCount()):
-                track_id = self.view.results_table.table.item(row, 0).text()
-                class_name = self.view.results_table.table.item(row, 1).text()
-                confidence = self.view.results_table.table.item(row, 2).text()
-                position = self.view.results_table.table.item(row, 3).text()
-                size = self.view.results_table.table.item(row, 4).text()
-
+            for track_id, class_name, confidence, position, size in table_rows:
                 rows.append(
                     {
                         "ID": track_id,
                         "Class": class_name,
-                        "Confidence": confidence,
+                        "Confidence": f"{confidence:.2f}",
                         "Position": position,
                         "Size": size,
-                        "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "Timestamp": export_time,
                     }
                 )
 
@@ -369,24 +633,43 @@ class AppController(QObject):
 
         self.view.show_error("No detection results to export")
 
-    def _auto_load_yolov8_model(self):
-        """Automatically load YOLOv8 model from the models folder"""
-        models_dir = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            ),
-            "models",
+    def _detections_to_dataframe(self, detections, export_time):
+        """Convert detections to an export DataFrame in a single construction"""
+        xyxy = detections.xyxy.astype(int)
+        classes = self.detection_model.class_names_for(detections.class_id)
+
+        if detections.tracker_id is not None:
+            ids = detections.tracker_id.astype(str)
+        else:
+            ids = np.full(len(detections), "N/A")
+
+        return pd.DataFrame(
+            {
+                "ID": ids,
+                "Class": classes,
+                "Confidence": np.round(detections.confidence, 2),
+                "Position": [f"({x}, {y})" for x, y in xyxy[:, :2]],
+                "Size": [f"{w}×{h}" for w, h in xyxy[:, 2:] - xyxy[:, :2]],
+                "Timestamp": export_time,
+            }
         )
 
-        # First refresh and get the model list
-        available_models = self.refresh_models()
+    def _auto_load_yolov8_model(self):
+        """Automatically load YOLOv8 model from the models folder"""
+        # Reuse the list scanned during startup instead of rescanning
+        available_models = self.detection_model.available_models
+        if not available_models:
+            available_models = self.refresh_models()
 
         # Try to find and load YOLOv8 model
-        yolo8_model = None
-        for path, name in available_models:
-            if "yolo8" in name.lower() or "yolov8" in name.lower():
-                yolo8_model = path
-                break
+        yolo8_model = next(
+            (
+                path
+                for path, name in available_models
+                if "yolo8" in name.casefold() or "yolov8" in name.casefold()
+            ),
+            None,
+        )
 
         # If found, load it
         if yolo8_model:
@@ -440,6 +723,7 @@ class AppController(QObject):
 
             # Update results table
             if result.detections is not None:
+                self._last_detections = result.detections
                 self.view.update_results_table(
                     result.detections, self.detection_model.class_names
                 )
@@ -455,79 +739,97 @@ class AppController(QObject):
             logger.error(f"Processing error: {str(e)}", exc_info=True)
 
     def _process_video(self, video_path: str):
-        """Process video file with detection model"""
+        """Process video file with detection model on a worker thread"""
         if not self.detection_model.model:
             self.view.show_error("No detection model loaded")
+            self.view.controls_panel.video_panel.on_processing_finished("")
             return
 
-        try:
-            cap = cv2.VideoCapture(video_path)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = int(cap.get(cv2.CAP_PROP_FPS))
-
-            # Set up output video writer
-            output_dir = os.path.join("output", "predictions", "videos")
-            os.makedirs(output_dir, exist_ok=True)
-
-            base_name = os.path.basename(video_path)
-            name, ext = os.path.splitext(base_name)
-            output_path = os.path.join(output_dir, f"{name}_prediction{ext}")
-
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            writer = cv2.VideoWriter(
-                output_path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height)
-            )
-
-            frame_count = 0
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
+        self._stop_video_worker()
 
-                # Convert frame to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                # Show original frame
-                self.view.show_original_image(frame_rgb)
-
-                # Run detection with tracking enabled
-                result = self.detection_model.detect(frame_rgb, is_video=True)
+        self.video_worker = VideoWorker(
+            self.detection_model,
+            video_path,
+            self.video_output_dir,
+            self.video_stride,
+        )
+        self.video_thread = QThread()
+        self.video_worker.moveToThread(self.video_thread)
+
+        # Results are delivered to the UI thread through queued connections
+        queued = Qt.ConnectionType.QueuedConnection
+        self.video_thread.started.connect(self.video_worker.run)
+        self.video_worker.frame_ready.connect(self._on_video_frame, queued)
+        self.video_worker.detections_ready.connect(self._on_video_detections, queued)
+        self.video_worker.progress_updated.connect(
+            self.view.controls_panel.video_panel.set_progress, queued
+        )
+        self.video_worker.error.connect(self.view.show_error, queued)
+        self.video_worker.finished.connect(self._on_video_finished, queued)
+        self.video_worker.finished.connect(self.video_thread.quit)
+
+        self.view.unified_display.set_mode("split")
+        self.video_thread.start()
+
+    def _on_video_frame(self, frame_rgb, annotated_frame):
+        """Show an original/annotated pair produced by the video worker"""
+        self.view.show_original_image(frame_rgb)
+        self.view.unified_display.update_frame(annotated_frame, True)
+
+    def _on_video_detections(self, detections):
+        """Update detection count and results table for a video frame"""
+        if detections is not None:
+            self.view.unified_display.update_detection_count(len(detections))
+            self._update_results_table(detections)
+        else:
+            self.view.unified_display.update_detection_count(0)
 
-                # Update display and save frame
-                if result.annotated_frame is not None:
-                    self.view.unified_display.update_frame(result.annotated_frame, True)
-                    prediction_bgr = cv2.cvtColor(
-                        result.annotated_frame, cv2.COLOR_RGB2BGR
-                    )
-                    writer.write(prediction_bgr)
-
-                    # Update detection count in unified display
-                    if result.detections is not None:
-                        num_objects = len(result.detections)
-                        self.view.unified_display.update_detection_count(num_objects)
-                    else:
-                        self.view.unified_display.update_detection_count(0)
-
-                # Update results table
-                if result.detections is not None:
-                    self.view.update_results_table(
-                        result.detections, self.detection_model.class_names
-                    )
+    def _on_video_finished(self, output_path):
+        """Handle the video worker finishing or being stopped"""
+        self.view.controls_panel.video_panel.on_processing_finished(output_path)
+        if output_path:
+            self.view.show_info(f"Saved processed video to {output_path}")
 
-                frame_count += 1
-                QApplication.processEvents()
+    def _stop_video_worker(self):
+        """Stop a running video worker and wait for its thread to exit"""
+        worker, thread = self.video_worker, self.video_thread
+        self.video_worker = None
+        self.video_thread = None
+        if worker is not None:
+            worker.stop()
+        if thread is None or thread.wait(0):
+            return
 
-            cap.release()
-            writer.release()
-            self.view.show_info(f"Saved processed video to {output_path}")
+        thread.quit()  # Ends the event loop once the worker's run() returns
+        if thread.wait(self.VIDEO_STOP_WAIT_MS):
+            return
 
-        except Exception as e:
-            self.view.show_error(f"Error processing video: {str(e)}")
-            logger.error(f"Video processing error: {str(e)}", exc_info=True)
+        # A long batch, like a first JIT compile, is still running. Destroying a
+        # running QThread aborts the process, so both are kept until it exits,
+        # with the worker cut off from the UI so a newer video isn't disturbed
+        logger.info("Video worker still finishing a batch, releasing it on exit")
+        for signal in (
+            worker.frame_ready,
+            worker.detections_ready,
+            worker.progress_updated,
+            worker.error,
+            worker.finished,
+        ):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        self._retired_video_threads[thread] = worker
+        thread.finished.connect(
+            lambda thread=thread: self._retired_video_threads.pop(thread, None),
+            Qt.ConnectionType.QueuedConnection,  # Released on the UI thread
+        )
+        if thread.isFinished():
+            self._retired_video_threads.pop(thread, None)
 
     def _on_video_stop(self):
         """Handle video stop request"""
+        self._stop_video_worker()
         # Clear the display
         self.view.unified_display.clear()
         # Clear results table
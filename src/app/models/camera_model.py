@@ -4,9 +4,12 @@ import platform
 import logging
 import numpy as np
 from enum import Enum, auto
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QWaitCondition, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
 from typing import Dict, List, Optional, Tuple, Union, Any
 import threading
+from concurrent.futures import ThreadPoolExecutor
+import os
+import importlib.util
 
 # Configure logging
 logging.basicConfig(
@@ -14,6 +17,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("CameraModel")
 
+# The platform never changes while running, look it up once at import
+_PLATFORM = platform.system().lower()
+_IS_WINDOWS = _PLATFORM == "windows"
+_IS_LINUX = _PLATFORM == "linux"
+_IS_MACOS = _PLATFORM == "darwin"
+
 
 class CameraBackend(Enum):
     """Camera backend options based on platform"""
@@ -28,14 +37,52 @@ class CameraBackend(Enum):
     @staticmethod
     def get_preferred_backend():
         """Returns the preferred backend for the current platform"""
-        system = platform.system().lower()
-        if system == "windows":
-            return CameraBackend.DSHOW  # DirectShow is preferred on Windows
-        elif system == "linux":
-            return CameraBackend.V4L  # V4L2 is preferred on Linux
-        elif system == "darwin":
-            return CameraBackend.ANY  # Default on macOS
-        return CameraBackend.ANY  # Default fallback
+        return _PREFERRED_BACKEND
+
+
+# DirectShow on Windows, V4L2 on Linux, OpenCV's default elsewhere
+if _IS_WINDOWS:
+    _PREFERRED_BACKEND = CameraBackend.DSHOW
+elif _IS_LINUX:
+    _PREFERRED_BACKEND = CameraBackend.V4L
+else:
+    _PREFERRED_BACKEND = CameraBackend.ANY
+
+# CV2 API constants for explicitly selected backends
+_BACKEND_MAP = {
+    CameraBackend.DSHOW: cv2.CAP_DSHOW,
+    CameraBackend.MSMF: cv2.CAP_MSMF,
+    CameraBackend.V4L: cv2.CAP_V4L,
+    CameraBackend.GSTREAMER: cv2.CAP_GSTREAMER,
+}
+
+# V4L2 VIDIOC_QUERYCAP ioctl and the struct v4l2_capability it fills
+_VIDIOC_QUERYCAP = 0x80685600  # _IOR('V', 0, struct v4l2_capability)
+_V4L2_CAPABILITY_FORMAT = "16s32s32sIII12x"  # driver, card, bus, version, caps
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+# Properties reported by get_camera_properties, resolved from cv2 once
+_CAMERA_PROPS = (
+    ("width", cv2.CAP_PROP_FRAME_WIDTH),
+    ("height", cv2.CAP_PROP_FRAME_HEIGHT),
+    ("fps", cv2.CAP_PROP_FPS),
+    ("format", cv2.CAP_PROP_FORMAT),
+    ("mode", cv2.CAP_PROP_MODE),
+    ("brightness", cv2.CAP_PROP_BRIGHTNESS),
+    ("contrast", cv2.CAP_PROP_CONTRAST),
+    ("saturation", cv2.CAP_PROP_SATURATION),
+    ("hue", cv2.CAP_PROP_HUE),
+    ("gain", cv2.CAP_PROP_GAIN),
+    ("exposure", cv2.CAP_PROP_EXPOSURE),
+)
+_PROBE_RESOLUTIONS = ((640, 480), (800, 600), (1280, 720), (1920, 1080))
+
+# Best default API for this platform when no specific backend is selected
+_PLATFORM_DEFAULT_BACKEND = {
+    "windows": cv2.CAP_DSHOW,
+    "linux": cv2.CAP_V4L,
+}.get(_PLATFORM, cv2.CAP_ANY)
 
 
 class CameraInfo:
@@ -53,37 +100,94 @@ class CameraInfo:
         return f"{self.name} (ID: {self.id}, API: {self.api_name})"
 
 
+class CameraInitTiming:
+    """Monotonic timestamps of each camera initialization stage"""
+
+    __slots__ = (
+        "prepare_start",
+        "prepare_end",
+        "open_start",
+        "open_end",
+        "configure_start",
+        "configure_end",
+        "first_frame_start",
+        "first_frame_end",
+        "total_init_time",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0.0)
+
+    def __repr__(self):
+        stages = ", ".join(
+            f"{name}={getattr(self, name):.3f}" for name in self.__slots__
+        )
+        return f"CameraInitTiming({stages})"
+
+
 class CameraThread(QThread):
     """Thread for camera capture to avoid blocking the UI"""
 
     frame_ready = pyqtSignal(np.ndarray)
+    preview_ready = pyqtSignal(np.ndarray)  # Frame fitted into preview_size
     error = pyqtSignal(str)
     connected = pyqtSignal(bool)
     status_message = pyqtSignal(str)
     progress_updated = pyqtSignal(int)  # 0-100 progress value
+    # (camera id, CameraBackend, CV2 API, (width, height), fps) after a good init
+    initialized_with = pyqtSignal(int, object, int, tuple, float)
 
     # Constants for timeout control
     CONNECT_TIMEOUT = 10.0  # Increased from 5.0 to 10.0 seconds
     FRAME_TIMEOUT = 2.0  # Increased from 0.5 to 2.0 seconds
-    MAX_FRAME_RETRIES = 3  # New constant for frame retry attempts
+    MAX_FRAME_RETRIES = 5  # Backed off retries give up after ~150ms in total
+    INITIAL_BACKOFF = 0.01  # First retry delay in seconds, doubled per failure
+    WATCHDOG_INTERVAL = 0.25  # Seconds between frame timeout checks
+    CAPTURE_FOURCC = "MJPG"  # Compressed USB transfer, decoded by OpenCV to BGR
 
-    def __init__(self, camera_id=0, resolution=(640, 480), fps=30, backend=None):
+    def __init__(
+        self,
+        camera_id=0,
+        resolution=(640, 480),
+        fps=30,
+        backend=None,
+        backend_api: Optional[int] = None,
+    ):
         super().__init__()
         self.camera_id = camera_id
         self.resolution = resolution
         self.fps = fps
         self.backend = backend if backend else CameraBackend.get_preferred_backend()
+        self.backend_api = backend_api  # CV2 API known to work for this camera
+        self.preview_size = None  # (width, height) box for previews, None disables
+        self._preview_dims = (None, None, None)  # (box, frame shape, fitted size)
         self.running = False
         self.cap = None
-        self.mutex = QMutex()
-        self.condition = QWaitCondition()
+        self.stop_event = threading.Event()  # Cuts frame pacing sleeps short on stop
         self.retry_count = 0
         self.max_retries = 2  # Reduced from 3 to speed up
         self.retry_delay = 1  # Reduced from 2 to speed up
         self.force_stop = False
+        self.gpu_decode = False  # True when frames are decoded by NVDEC as RGB
+
+        # Live cameras are grabbed on a helper thread and decoded on this one
+        self._cap_lock = threading.Lock()  # cv2.VideoCapture is not thread safe
+        # Set by the watchdog, the thread blocked in the driver reopens the capture
+        self._reopen_requested = threading.Event()
+        self._frame_grabbed = threading.Event()
+        self._grab_ok = False
+        self._grabbing = False
+
+        # Preallocated BGR decode target, converted to a fresh RGB array per frame
+        self._decode_buf = None
+
+        # One watchdog thread supervises blocking reads instead of a timer per frame
+        self._read_started = None  # time.monotonic() of the read in flight
+        self._watching = False
 
         # Timing diagnostics
-        self.timing = {}
+        self.timing = CameraInitTiming()
 
         # Initialization stages for better progress reporting
         self.init_stages = {
@@ -96,7 +200,8 @@ class CameraThread(QThread):
     def run(self):
         """Thread main loop for capturing frames"""
         self.retry_count = 0
-        self.timing = {}
+        self.timing = CameraInitTiming()
+        self._start_watchdog()
 
         while self.retry_count < self.max_retries and not self.force_stop:
             try:
@@ -158,20 +263,22 @@ class CameraThread(QThread):
             # Log timing information
             logger.error(f"Camera initialization timing: {self.timing}")
 
+        self._watching = False
+
     def _initialize_camera(self) -> bool:
         """Initialize the camera with timeout control"""
         # Prepare stage - 10%
-        self.timing["prepare_start"] = time.time()
+        self.timing.prepare_start = time.monotonic()
         self.progress_updated.emit(0)
         self.status_message.emit(f"Preparing to connect to camera {self.camera_id}...")
 
         # Try to prepare fast backend options based on platform
         backend_int = self._get_backend_int()
         self.progress_updated.emit(self.init_stages["prepare"])
-        self.timing["prepare_end"] = time.time()
+        self.timing.prepare_end = time.monotonic()
 
         # Open stage - 30%
-        self.timing["open_start"] = time.time()
+        self.timing.open_start = time.monotonic()
         self.status_message.emit(f"Opening camera {self.camera_id}...")
 
         # Use a timer to enforce timeout
@@ -181,8 +288,10 @@ class CameraThread(QThread):
 
         try:
             if isinstance(self.camera_id, str):
-                # Handle URL/path case
-                self.cap = cv2.VideoCapture(self.camera_id)
+                # Handle URL/path case, decoding video files on the GPU if possible
+                self.cap = self._open_gpu_decoder() or cv2.VideoCapture(
+                    self.camera_id
+                )
             else:
                 # Hardware camera case with selected backend
                 self.cap = cv2.VideoCapture(self.camera_id, backend_int)
@@ -192,30 +301,44 @@ class CameraThread(QThread):
                 timer.cancel()
                 return False
 
-            self.timing["open_end"] = time.time()
+            # Keep only the newest frame in the driver queue
+            self._limit_buffer()
+
+            self.timing.open_end = time.monotonic()
             self.progress_updated.emit(
                 self.init_stages["prepare"] + self.init_stages["open"]
             )
 
             # Configure stage - 20%
-            self.timing["configure_start"] = time.time()
+            self.timing.configure_start = time.monotonic()
             self.status_message.emit(f"Configuring camera {self.camera_id}...")
 
-            # Configure camera properties - limit to essential properties
-            # Set resolution (with error handling)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
-
-            # Only set FPS if not default
-            if self.fps != 30:
-                self.cap.set(cv2.CAP_PROP_FPS, self.fps)
-
-            # Get actual properties
-            actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            actual_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
-
-            self.timing["configure_end"] = time.time()
+            if self.gpu_decode:
+                # Hardware decoder output size is fixed by the file
+                actual_width = self.cap.width
+                actual_height = self.cap.height
+                actual_fps = self.cap.fps
+            else:
+                # Configure camera properties - limit to essential properties
+                # Ask live cameras for MJPEG before sizing, V4L2 picks the
+                # available resolutions per pixel format
+                if not isinstance(self.camera_id, str):
+                    self._request_mjpeg()
+
+                # Set resolution (with error handling)
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+
+                # Only set FPS if not default
+                if self.fps != 30:
+                    self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+                # Get actual properties
+                actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                actual_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
+
+            self.timing.configure_end = time.monotonic()
             self.progress_updated.emit(
                 self.init_stages["prepare"]
                 + self.init_stages["open"]
@@ -223,70 +346,89 @@ class CameraThread(QThread):
             )
 
             # First frame - 40%
-            self.timing["first_frame_start"] = time.time()
+            self.timing.first_frame_start = time.monotonic()
             self.status_message.emit("Getting first frame...")
 
-            # Set a frame timeout to prevent stalling
-            frame_timer = threading.Timer(self.FRAME_TIMEOUT, self._frame_timeout)
-            frame_timer.daemon = True
-            frame_timer.start()
-
-            # Try to get the first frame
+            # Try to get the first frame, the watchdog catches a stalled read
+            self._read_started = time.monotonic()
             ret, first_frame = self.cap.read()
-            frame_timer.cancel()
+            self._read_started = None
+            # A stalled first read either failed, and init is retried, or recovered
+            self._reopen_requested.clear()
 
             if not ret:
                 raise IOError("Failed to get first frame from camera")
 
+            # Size the decode buffer from a real frame, backends may misreport
+            self._decode_buf = None if self.gpu_decode else np.empty_like(first_frame)
+
             # Success - cancel main timer
             timer.cancel()
 
-            self.timing["first_frame_end"] = time.time()
+            self.timing.first_frame_end = time.monotonic()
             self.progress_updated.emit(100)  # Full progress
 
             # Log success
             logger.info(
                 f"Camera initialized: {actual_width}x{actual_height} @ {actual_fps}fps"
             )
+            if not isinstance(self.camera_id, str):
+                self.initialized_with.emit(
+                    self.camera_id,
+                    self.backend,
+                    backend_int,
+                    (actual_width, actual_height),
+                    float(actual_fps),
+                )
             self.status_message.emit(
                 f"Camera ready: {actual_width}x{actual_height} @ {actual_fps:.1f}fps"
             )
 
             # Calculate timing totals
-            self.timing["total_init_time"] = (
-                self.timing["first_frame_end"] - self.timing["prepare_start"]
+            self.timing.total_init_time = (
+                self.timing.first_frame_end - self.timing.prepare_start
             )
             logger.info(
-                f"Camera initialization completed in {self.timing['total_init_time']:.3f} seconds"
+                f"Camera initialization completed in {self.timing.total_init_time:.3f} seconds"
             )
 
             return True
 
         except Exception as e:
             timer.cancel()
-            if "frame_timer" in locals():
-                frame_timer.cancel()
+            self._read_started = None
             logger.error(f"Error during camera initialization: {str(e)}")
             return False
 
+    def _open_gpu_decoder(self):
+        """Open a local video file with NVDEC via ffmpegcv, if available"""
+        self.gpu_decode = False
+        if not os.path.isfile(self.camera_id):
+            return None
+        if importlib.util.find_spec("ffmpegcv") is None:
+            return None
+
+        try:
+            import ffmpegcv
+
+            # Decode straight to RGB so the capture loop can skip cvtColor
+            cap = ffmpegcv.VideoCaptureNV(self.camera_id, pix_fmt="rgb24")
+            if not cap.isOpened():
+                cap.release()
+                return None
+
+            self.gpu_decode = True
+            logger.info(f"Using NVDEC hardware decoding for {self.camera_id}")
+            return cap
+        except Exception as e:
+            logger.warning(f"GPU decoding unavailable, using OpenCV: {str(e)}")
+            return None
+
     def _get_backend_int(self) -> int:
         """Get the actual CV2 API constant for the selected backend"""
-        if self.backend == CameraBackend.DSHOW:
-            return cv2.CAP_DSHOW
-        elif self.backend == CameraBackend.MSMF:
-            return cv2.CAP_MSMF
-        elif self.backend == CameraBackend.V4L:
-            return cv2.CAP_V4L
-        elif self.backend == CameraBackend.GSTREAMER:
-            return cv2.CAP_GSTREAMER
-        else:
-            # Use best default for platform
-            system = platform.system().lower()
-            if system == "windows":
-                return cv2.CAP_DSHOW
-            elif system == "linux":
-                return cv2.CAP_V4L
-            return cv2.CAP_ANY
+        if self.backend_api is not None:
+            return self.backend_api
+        return _BACKEND_MAP.get(self.backend, _PLATFORM_DEFAULT_BACKEND)
 
     def _connection_timeout(self):
         """Handle connection timeout"""
@@ -295,39 +437,176 @@ class CameraThread(QThread):
         if self.cap:
             self._release_camera()
 
+    def _start_watchdog(self):
+        """Start the thread that times out reads stuck in the driver"""
+        self._read_started = None
+        self._watching = True
+        watchdog = threading.Thread(target=self._watchdog_loop)
+        watchdog.daemon = True
+        watchdog.start()
+
+    def _watchdog_loop(self):
+        """Call _frame_timeout once for any read running past FRAME_TIMEOUT"""
+        while self._watching and not self.force_stop:
+            time.sleep(self.WATCHDOG_INTERVAL)
+            read_started = self._read_started
+            if (
+                read_started is not None
+                and time.monotonic() - read_started > self.FRAME_TIMEOUT
+            ):
+                self._read_started = None
+                self._frame_timeout()
+
     def _frame_timeout(self):
         """Handle frame read timeout"""
         logger.error("Frame read timeout")
-        # Don't force stop immediately, let retry mechanism handle it
+        # Releasing here would free the capture under the blocked call, so the
+        # reading thread reopens it once the call returns. Don't force stop
+        # immediately, let retry mechanism handle it
+        if not self.force_stop:
+            self._reopen_requested.set()
+
+    def _reopen_capture(self):
+        """Release and reopen a timed out capture, called with _cap_lock held"""
+        self._reopen_requested.clear()
         if self.cap and not self.force_stop:
             # Try to restart the camera capture
             self.cap.release()
-            self.cap = cv2.VideoCapture(self.camera_id, self._get_backend_int())
+            if self.gpu_decode:
+                self.cap = self._open_gpu_decoder() or cv2.VideoCapture(
+                    self.camera_id
+                )
+            else:
+                self.cap = cv2.VideoCapture(self.camera_id, self._get_backend_int())
+                self._limit_buffer()
+
+    def _request_mjpeg(self):
+        """Switch a live camera to MJPEG so high resolutions fit the USB link"""
+        try:
+            fourcc = cv2.VideoWriter_fourcc(*self.CAPTURE_FOURCC)
+            if not self.cap.set(cv2.CAP_PROP_FOURCC, fourcc):
+                logger.info(f"Camera does not support {self.CAPTURE_FOURCC} capture")
+        except Exception as e:
+            logger.warning(f"Could not set camera pixel format: {str(e)}")
+
+    def _limit_buffer(self):
+        """Shrink a live camera's driver buffer to a single frame"""
+        if self.gpu_decode or isinstance(self.camera_id, str):
+            return
+        try:
+            if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                logger.info("Camera backend ignores CAP_PROP_BUFFERSIZE")
+        except Exception as e:
+            logger.warning(f"Could not set camera buffer size: {str(e)}")
+
+    def _start_grab_thread(self):
+        """Start grabbing a live camera continuously so its queue stays empty"""
+        self._frame_grabbed.clear()
+        self._grabbing = True
+        grabber = threading.Thread(target=self._grab_loop)
+        grabber.daemon = True
+        grabber.start()
+        return grabber
+
+    def _grab_loop(self):
+        """Grab frames without decoding them, keeping only the newest"""
+        backoff = self.INITIAL_BACKOFF
+        while self._grabbing and not self.force_stop:
+            with self._cap_lock:
+                cap = self.cap
+                self._read_started = time.monotonic()
+                ok = cap.grab() if cap is not None else False
+                self._read_started = None
+                if self._reopen_requested.is_set():
+                    self._reopen_capture()
+                    ok = False
+            self._grab_ok = ok
+            self._frame_grabbed.set()
+
+            if ok:
+                backoff = self.INITIAL_BACKOFF
+                time.sleep(0)  # Let a waiting retrieve take the lock
+            else:
+                backoff = self._back_off(backoff)
+
+    def _read_frame(self):
+        """Read the next frame, decoding the newest grab for live cameras"""
+        if self._decode_buf is None:
+            # NVDEC captures hand out their own arrays
+            self._read_started = time.monotonic()
+            try:
+                ret, frame = self.cap.read()
+            finally:
+                self._read_started = None
+            return (False, None) if self._reopen_after_timeout() else (ret, frame)
+
+        # Decode into the reused buffer, _emit_frame hands out owned copies only
+        buffer = self._decode_buf
+
+        if not self._grabbing:
+            self._read_started = time.monotonic()
+            try:
+                ret, frame = self.cap.read(buffer)
+            finally:
+                self._read_started = None
+            if self._reopen_after_timeout():
+                return False, None
+        else:
+            if not self._frame_grabbed.wait(self.FRAME_TIMEOUT):
+                return False, None
+            self._frame_grabbed.clear()
+            if not self._grab_ok:
+                return False, None
+
+            with self._cap_lock:
+                if self.cap is None:
+                    return False, None
+                ret, frame = self.cap.retrieve(buffer)
+
+        # OpenCV allocates a new array if the frame size changed, keep that one
+        if ret and frame is not buffer:
+            self._decode_buf = frame
+        return ret, frame
+
+    def _reopen_after_timeout(self) -> bool:
+        """Reopen the capture after a read the watchdog timed out, if it did"""
+        if not self._reopen_requested.is_set():
+            return False
+        with self._cap_lock:
+            self._reopen_capture()
+        return True
 
     def _run_capture_loop(self):
         """Run the main frame capture loop"""
+        # Backends that ignore CAP_PROP_BUFFERSIZE still serve the newest frame
+        grabber = None
+        if not self.gpu_decode and not isinstance(self.camera_id, str):
+            grabber = self._start_grab_thread()
+
+        try:
+            self._capture_frames()
+        finally:
+            self._grabbing = False
+            if grabber is not None:
+                grabber.join(self.FRAME_TIMEOUT)
+
+    def _capture_frames(self):
+        """Decode, convert and emit frames until stopped or failing"""
         frame_interval = 1.0 / self.fps
         frame_count = 0
         error_count = 0
-        last_frame_time = time.time()
         frame_retry_count = 0
+        backoff = self.INITIAL_BACKOFF
+        next_deadline = time.monotonic() + frame_interval
 
         while self.running and not self.force_stop:
-            start_time = time.time()
-
             if not self.cap or not self.cap.isOpened():
                 logger.error("Camera disconnected")
                 self.error.emit("Camera disconnected")
                 break
 
             try:
-                # Set a frame read timeout
-                frame_timer = threading.Timer(self.FRAME_TIMEOUT, self._frame_timeout)
-                frame_timer.daemon = True
-                frame_timer.start()
-
-                ret, frame = self.cap.read()
-                frame_timer.cancel()
+                ret, frame = self._read_frame()
 
                 if not ret:
                     frame_retry_count += 1
@@ -343,36 +622,26 @@ class CameraThread(QThread):
                         )
                         break
 
-                    # Short delay before retry
-                    time.sleep(0.1)
+                    # Back off before retrying, a single dropped frame recovers fast
+                    backoff = self._back_off(backoff)
                     continue
 
                 # Reset counters on successful frame read
                 frame_retry_count = 0
                 error_count = 0
+                backoff = self.INITIAL_BACKOFF
                 frame_count += 1
 
-                # Calculate actual FPS
-                current_time = time.time()
-                actual_fps = (
-                    1.0 / (current_time - last_frame_time)
-                    if last_frame_time
-                    else self.fps
-                )
-                last_frame_time = current_time
+                self._emit_frame(frame)
 
-                # Convert and emit frame
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                self.frame_ready.emit(frame_rgb)
-
-                # FPS control
-                if self.fps < 30:
-                    elapsed = time.time() - start_time
-                    sleep_time = max(0, frame_interval - elapsed)
-                    if sleep_time > 0:
-                        self.mutex.lock()
-                        self.condition.wait(self.mutex, int(sleep_time * 1000))
-                        self.mutex.unlock()
+                # FPS control, paced against a deadline so sleeps don't drift
+                sleep_time = next_deadline - time.monotonic()
+                if sleep_time > 0:
+                    self.stop_event.wait(sleep_time)
+                    next_deadline += frame_interval
+                else:
+                    # Running behind, restart pacing instead of bursting to catch up
+                    next_deadline = time.monotonic() + frame_interval
 
             except Exception as e:
                 logger.error(f"Error during frame capture: {str(e)}")
@@ -381,8 +650,44 @@ class CameraThread(QThread):
                     self.error.emit(f"Persistent capture error: {str(e)}")
                     break
 
-                # Add small delay before retry
-                time.sleep(0.1)
+                # Back off before retrying
+                backoff = self._back_off(backoff)
+
+    def _emit_frame(self, frame: np.ndarray):
+        """Publish a captured frame as full RGB and preview"""
+        # Emit the frame as a fresh RGB array. Receivers keep it for as long
+        # as detection and display take, while the decode buffer is reused
+        # on the next read
+        frame_rgb = (
+            frame if self.gpu_decode else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        )
+        self.frame_ready.emit(frame_rgb)
+
+        # Downscale here so the UI thread only handles display sized frames
+        if self.preview_size is not None:
+            self.preview_ready.emit(self._make_preview(frame_rgb))
+
+    def _make_preview(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink a frame to fit preview_size, keeping its aspect ratio"""
+        box = self.preview_size
+        shape = frame.shape[:2]
+        cached_box, cached_shape, size = self._preview_dims
+        if cached_box != box or cached_shape != shape:
+            frame_height, frame_width = shape
+            scale = min(box[0] / frame_width, box[1] / frame_height, 1.0)
+            size = (
+                max(1, int(frame_width * scale)),
+                max(1, int(frame_height * scale)),
+            )
+            self._preview_dims = (box, shape, size)
+
+        # A fresh array per preview, receivers get it through a queued signal
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _back_off(self, delay: float) -> float:
+        """Sleep for delay, unless stopped, and return the next delay to use"""
+        self.stop_event.wait(delay)
+        return min(delay * 2, self.retry_delay)
 
     def _release_camera(self):
         """Helper method to safely release camera resources"""
@@ -398,10 +703,8 @@ class CameraThread(QThread):
         self.running = False
         self.force_stop = True
 
-        # Wake up any sleeping wait condition
-        self.mutex.lock()
-        self.condition.wakeAll()
-        self.mutex.unlock()
+        # Wake up a frame pacing sleep
+        self.stop_event.set()
 
         # Wait for thread to finish (with timeout)
         self.wait(2000)  # Reduced timeout to 2 seconds
@@ -416,16 +719,39 @@ class CameraThread(QThread):
         self._release_camera()
 
 
+class CameraScanThread(QThread):
+    """Thread for camera enumeration so driver probing doesn't block the UI"""
+
+    cameras_found = pyqtSignal(list)  # Emits list of CameraInfo objects
+
+    def __init__(self, detect_fn):
+        super().__init__()
+        self.detect_fn = detect_fn
+
+    def run(self):
+        """Run the camera scan and report the result"""
+        try:
+            cameras = self.detect_fn()
+        except Exception as e:
+            logger.error(f"Error scanning cameras: {str(e)}")
+            cameras = []
+        self.cameras_found.emit(cameras)
+
+
 class CameraModel(QObject):
     """Model for managing camera capture"""
 
     frame_captured = pyqtSignal(np.ndarray)
+    preview_captured = pyqtSignal(np.ndarray)  # Display sized copy of each frame
     camera_error = pyqtSignal(str)
     camera_status = pyqtSignal(str)
     camera_connected = pyqtSignal(bool)
     camera_list_updated = pyqtSignal(list)  # Emits list of CameraInfo objects
     camera_progress = pyqtSignal(int)  # 0-100 progress value
 
+    RESTART_DELAY_MS = 100  # Settings changes within this window share one restart
+    PROBE_WORKERS = 10  # Camera indices probed at the same time
+
     def __init__(self):
         super().__init__()
         self.camera_thread = None
@@ -434,7 +760,20 @@ class CameraModel(QObject):
         self.current_resolution = (640, 480)
         self.current_fps = 30
         self.current_backend = CameraBackend.get_preferred_backend()
-        self.camera_cache = {}  # Cache of camera properties to speed up init
+        self.camera_cache = {}  # camera_id -> settings of its last successful init
+        self.preview_size = None  # (width, height) the UI displays previews at
+        self.scan_thread = None
+
+        # Probe workers persist across scans, each keeps one reusable capture
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=self.PROBE_WORKERS, thread_name_prefix="CameraProbe"
+        )
+        self._probe_local = threading.local()
+
+        # Coalesces setter calls so a burst of changes restarts the camera once
+        self._restart_timer = QTimer(self)
+        self._restart_timer.setSingleShot(True)
+        self._restart_timer.timeout.connect(self._restart_camera)
 
         # Initialize available cameras list with lower overhead approach
         self._refresh_available_cameras(use_fast_scan=True)
@@ -459,33 +798,15 @@ class CameraModel(QObject):
 
     def _fast_detect_cameras(self) -> List[CameraInfo]:
         """Quick camera detection method - tries common indices only"""
-        cameras = []
-        system = platform.system().lower()
-
         # Choose appropriate backend
         backend = None
-        if system == "windows":
+        if _IS_WINDOWS:
             backend = cv2.CAP_DSHOW
-        elif system == "linux":
+        elif _IS_LINUX:
             backend = cv2.CAP_V4L
 
         # Only check the most common camera indices (0,1)
-        for i in range(2):
-            try:
-                # Quick open/close test
-                if backend:
-                    cap = cv2.VideoCapture(i, backend)
-                else:
-                    cap = cv2.VideoCapture(i)
-
-                if cap.isOpened():
-                    name = f"Camera {i}"
-                    api_name = "Auto-detected"
-                    cameras.append(CameraInfo(i, name, api_name))
-
-                cap.release()
-            except Exception as e:
-                pass
+        cameras = self._probe_cameras([0, 1], backend, "Auto-detected")
 
         # Ensure at least camera 0 is in the list
         if not cameras:
@@ -498,14 +819,12 @@ class CameraModel(QObject):
         cameras = []
 
         # First try platform-specific detection
-        system = platform.system().lower()
-
         try:
-            if system == "windows":
+            if _IS_WINDOWS:
                 cameras = self._detect_cameras_windows()
-            elif system == "linux":
+            elif _IS_LINUX:
                 cameras = self._detect_cameras_linux()
-            elif system == "darwin":
+            elif _IS_MACOS:
                 cameras = self._detect_cameras_macos()
         except Exception as e:
             logger.error(f"Error in platform-specific camera detection: {str(e)}")
@@ -521,37 +840,67 @@ class CameraModel(QObject):
 
         return cameras
 
-    def _detect_cameras_generic(self) -> List[CameraInfo]:
-        """Generic camera detection method using OpenCV"""
-        cameras = []
+    @staticmethod
+    def _probe_camera(
+        cap, index: int, backend: Optional[int], api_name: str, name_prefix: str
+    ) -> Optional[CameraInfo]:
+        """Open a camera index briefly on cap and describe it if it exists"""
+        try:
+            if backend is None:
+                opened = cap.open(index)
+            else:
+                opened = cap.open(index, backend)
+            if not opened:
+                return None
 
-        # Check the first few indices (0-9)
-        for i in range(10):
-            try:
-                # Try to open the camera briefly just to check if it exists
-                cap = cv2.VideoCapture(i)
-                if cap.isOpened():
-                    # Get some basic info if possible
-                    name = f"Camera {i}"
-                    api_name = "Unknown"
-
-                    # Try to get more info
-                    try:
-                        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                        name = f"Camera {i} ({width}x{height})"
-                    except:
-                        pass
-
-                    cameras.append(CameraInfo(i, name, api_name))
-
-                # Always release the capture
-                cap.release()
+            name = f"{name_prefix} {index}"
 
-            except Exception as e:
-                logger.debug(f"Error checking camera index {i}: {str(e)}")
+            # Get resolution
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            if width > 0 and height > 0:
+                name = f"{name_prefix} {index} ({width}x{height})"
 
-        return cameras
+            return CameraInfo(index, name, api_name)
+
+        except Exception as e:
+            logger.debug(f"Error checking {api_name} camera {index}: {str(e)}")
+            return None
+        finally:
+            # Release the stream but keep the capture object for the next probe
+            cap.release()
+
+    def _probe_cameras(
+        self,
+        indices: List[int],
+        backend: Optional[int] = None,
+        api_name: str = "Unknown",
+        name_prefix: str = "Camera",
+    ) -> List[CameraInfo]:
+        """Probe camera indices in parallel, each open blocks on driver I/O"""
+        if not indices:
+            return []
+
+        results = self._probe_executor.map(
+            lambda i: self._probe_camera(
+                self._probe_capture(), i, backend, api_name, name_prefix
+            ),
+            indices,
+        )
+        return [camera for camera in results if camera is not None]
+
+    def _probe_capture(self):
+        """Get the calling probe worker's VideoCapture, created on first use"""
+        cap = getattr(self._probe_local, "cap", None)
+        if cap is None:
+            cap = cv2.VideoCapture()
+            self._probe_local.cap = cap
+        return cap
+
+    def _detect_cameras_generic(self) -> List[CameraInfo]:
+        """Generic camera detection method using OpenCV"""
+        # Check the first few indices (0-9)
+        return self._probe_cameras(list(range(10)))
 
     def _detect_cameras_windows(self) -> List[CameraInfo]:
         """Windows-specific camera detection using DirectShow"""
@@ -559,46 +908,15 @@ class CameraModel(QObject):
 
         try:
             # First, try DirectShow backend which often works better on Windows
-            for i in range(10):
-                try:
-                    cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-                    if cap.isOpened():
-                        # Get device name if possible
-                        name = f"Camera {i}"
-                        api_name = "DirectShow"
-
-                        # Get resolution
-                        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                        if width > 0 and height > 0:
-                            name = f"Camera {i} ({width}x{height})"
-
-                        cameras.append(CameraInfo(i, name, api_name))
-                    cap.release()
-                except Exception as e:
-                    logger.debug(f"Error checking DirectShow camera {i}: {str(e)}")
+            cameras = self._probe_cameras(
+                list(range(10)), cv2.CAP_DSHOW, "DirectShow"
+            )
 
             # Then try the Media Foundation backend (newer Windows API)
             if not cameras:
-                for i in range(10):
-                    try:
-                        cap = cv2.VideoCapture(i, cv2.CAP_MSMF)
-                        if cap.isOpened():
-                            name = f"Camera {i}"
-                            api_name = "Media Foundation"
-
-                            # Get resolution
-                            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                            if width > 0 and height > 0:
-                                name = f"Camera {i} ({width}x{height})"
-
-                            cameras.append(CameraInfo(i, name, api_name))
-                        cap.release()
-                    except Exception as e:
-                        logger.debug(
-                            f"Error checking Media Foundation camera {i}: {str(e)}"
-                        )
+                cameras = self._probe_cameras(
+                    list(range(10)), cv2.CAP_MSMF, "Media Foundation"
+                )
         except Exception as e:
             logger.error(f"Error in Windows camera detection: {str(e)}")
 
@@ -610,64 +928,65 @@ class CameraModel(QObject):
 
         try:
             # Check /dev/video* devices which is standard on Linux
-            import glob
-            import re
-
-            # Find all video devices
-            video_devices = glob.glob("/dev/video*")
-
-            for device in video_devices:
-                try:
-                    # Extract device number
-                    match = re.search(r"/dev/video(\d+)", device)
-                    if match:
-                        device_id = int(match.group(1))
-
-                        # Try opening with V4L2
-                        cap = cv2.VideoCapture(device_id, cv2.CAP_V4L)
-                        if cap.isOpened():
-                            name = f"V4L2 Camera {device_id}"
-                            api_name = "V4L2"
-
-                            # Get resolution
-                            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                            if width > 0 and height > 0:
-                                name = f"V4L2 Camera {device_id} ({width}x{height})"
-
-                            cameras.append(CameraInfo(device_id, name, api_name))
-                        cap.release()
-                except Exception as e:
-                    logger.debug(f"Error checking V4L2 device {device}: {str(e)}")
+            device_ids = []
+            with os.scandir("/dev") as entries:
+                for entry in entries:
+                    suffix = entry.name[5:]
+                    if entry.name.startswith("video") and suffix.isdigit():
+                        device_ids.append(int(suffix))
+
+            # Ask the driver directly, opening a stream for every node is slow
+            for device_id in sorted(device_ids):
+                camera = self._query_v4l2_device(device_id)
+                if camera is not None:
+                    cameras.append(camera)
 
         except Exception as e:
             logger.error(f"Error in Linux camera detection: {str(e)}")
 
         return cameras
 
+    @staticmethod
+    def _query_v4l2_device(device_id: int) -> Optional[CameraInfo]:
+        """Describe a V4L2 node with VIDIOC_QUERYCAP if it can capture video"""
+        import fcntl
+        import struct
+
+        try:
+            fd = os.open(f"/dev/video{device_id}", os.O_RDWR | os.O_NONBLOCK)
+        except OSError as e:
+            logger.debug(f"Error opening V4L2 device {device_id}: {str(e)}")
+            return None
+
+        try:
+            buffer = bytearray(struct.calcsize(_V4L2_CAPABILITY_FORMAT))
+            fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buffer)
+        except OSError as e:
+            logger.debug(f"Error querying V4L2 device {device_id}: {str(e)}")
+            return None
+        finally:
+            os.close(fd)
+
+        _, card, _, _, capabilities, device_caps = struct.unpack(
+            _V4L2_CAPABILITY_FORMAT, buffer
+        )
+
+        # Metadata nodes share the driver's capabilities, check the node's own
+        if capabilities & _V4L2_CAP_DEVICE_CAPS:
+            capabilities = device_caps
+        if not capabilities & _V4L2_CAP_VIDEO_CAPTURE:
+            return None
+
+        name = card.split(b"\0", 1)[0].decode("utf-8", "replace").strip()
+        return CameraInfo(device_id, name or f"V4L2 Camera {device_id}", "V4L2")
+
     def _detect_cameras_macos(self) -> List[CameraInfo]:
         """macOS-specific camera detection"""
         # macOS typically uses the default AVFoundation back-end in OpenCV
         cameras = []
 
         try:
-            for i in range(10):
-                try:
-                    cap = cv2.VideoCapture(i)
-                    if cap.isOpened():
-                        name = f"Camera {i}"
-                        api_name = "AVFoundation"
-
-                        # Get resolution
-                        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                        if width > 0 and height > 0:
-                            name = f"Camera {i} ({width}x{height})"
-
-                        cameras.append(CameraInfo(i, name, api_name))
-                    cap.release()
-                except Exception as e:
-                    logger.debug(f"Error checking AVFoundation camera {i}: {str(e)}")
+            cameras = self._probe_cameras(list(range(10)), api_name="AVFoundation")
         except Exception as e:
             logger.error(f"Error in macOS camera detection: {str(e)}")
 
@@ -681,6 +1000,9 @@ class CameraModel(QObject):
         backend: Optional[CameraBackend] = None,
     ) -> bool:
         """Start camera capture with specified parameters"""
+        # This start already picks up any pending settings change
+        self._restart_timer.stop()
+
         # Stop any existing camera thread
         self.stop_camera()
 
@@ -702,15 +1024,28 @@ class CameraModel(QObject):
             self.camera_status.emit(f"Connecting to camera {camera_id}...")
             self.camera_progress.emit(0)  # Reset progress
 
+            # Reuse the API that last opened this camera with the same backend
+            cached = self.camera_cache.get(camera_id)
+            backend_api = (
+                cached["backend_api"]
+                if cached and cached["backend"] == backend
+                else None
+            )
+
             # Create and start camera thread with progress monitoring
-            self.camera_thread = CameraThread(camera_id, resolution, fps, backend)
+            self.camera_thread = CameraThread(
+                camera_id, resolution, fps, backend, backend_api
+            )
 
             # Connect signals
             self.camera_thread.frame_ready.connect(self.frame_captured)
+            self.camera_thread.preview_ready.connect(self.preview_captured)
+            self.camera_thread.preview_size = self.preview_size
             self.camera_thread.error.connect(self.camera_error)
             self.camera_thread.status_message.connect(self.camera_status)
             self.camera_thread.connected.connect(self.camera_connected)
             self.camera_thread.progress_updated.connect(self.camera_progress)
+            self.camera_thread.initialized_with.connect(self._cache_camera)
 
             # Setup priority (lower than UI thread) for better responsiveness
             self.camera_thread.setPriority(QThread.Priority.LowPriority)
@@ -733,6 +1068,15 @@ class CameraModel(QObject):
             self.camera_progress.emit(0)  # Reset progress
             return False
 
+    def _cache_camera(self, camera_id, backend, backend_api, size, fps):
+        """Remember how a camera was opened so the next start can skip guessing"""
+        self.camera_cache[camera_id] = {
+            "backend": backend,
+            "backend_api": backend_api,
+            "size": size,
+            "fps": fps,
+        }
+
     def stop_camera(self):
         """Stop camera capture"""
         if self.camera_thread and self.camera_thread.isRunning():
@@ -748,48 +1092,56 @@ class CameraModel(QObject):
         return self.available_cameras
 
     def refresh_cameras(self):
-        """Refresh the list of available cameras"""
+        """Refresh the list of available cameras on a background thread"""
+        if self.scan_thread and self.scan_thread.isRunning():
+            return
+
         self.camera_status.emit("Scanning for cameras...")
-        self._refresh_available_cameras()
+        self.scan_thread = CameraScanThread(self._detect_cameras)
+        self.scan_thread.cameras_found.connect(self._on_cameras_scanned)
+        self.scan_thread.start()
+
+    def _on_cameras_scanned(self, cameras: List[CameraInfo]):
+        """Publish the result of a background camera scan"""
+        self.available_cameras = cameras
+        self.camera_list_updated.emit(self.available_cameras)
         self.camera_status.emit(f"Found {len(self.available_cameras)} cameras")
 
+    def set_preview_size(self, width: int, height: int):
+        """Set the box camera previews are fitted into, this needs no restart"""
+        self.preview_size = (width, height) if width > 1 and height > 1 else None
+        if self.camera_thread:
+            self.camera_thread.preview_size = self.preview_size
+
     def set_resolution(self, width: int, height: int):
         """Set camera resolution"""
         self.current_resolution = (width, height)
-        if self.camera_thread and self.camera_thread.isRunning():
-            # Restart camera with new resolution
-            self.start_camera()
+        self._schedule_restart()
 
     def set_fps(self, fps: int):
         """Set camera FPS"""
         self.current_fps = fps
-        if self.camera_thread and self.camera_thread.isRunning():
-            # Restart camera with new FPS
-            self.start_camera()
+        self._schedule_restart()
 
     def set_backend(self, backend):
         """Set camera backend based on platform availability"""
-        import platform
-
-        system = platform.system().lower()
-
         if backend == CameraBackend.ANY:
             self._backend = cv2.CAP_ANY
-        elif system == "windows":
+        elif _IS_WINDOWS:
             if backend == CameraBackend.DSHOW:
                 self._backend = cv2.CAP_DSHOW
             elif backend == CameraBackend.MSMF:
                 self._backend = cv2.CAP_MSMF
             else:
                 self._backend = cv2.CAP_ANY
-        elif system == "linux":
+        elif _IS_LINUX:
             if backend == CameraBackend.V4L:
                 self._backend = cv2.CAP_V4L2
             elif backend == CameraBackend.GSTREAMER:
                 self._backend = cv2.CAP_GSTREAMER
             else:
                 self._backend = cv2.CAP_ANY
-        elif system == "darwin":  # macOS
+        elif _IS_MACOS:
             if backend == CameraBackend.AVFOUNDATION:
                 self._backend = cv2.CAP_AVFOUNDATION
             else:
@@ -797,10 +1149,32 @@ class CameraModel(QObject):
         else:
             self._backend = cv2.CAP_ANY
 
+        self._schedule_restart()
+
+    def _schedule_restart(self):
+        """Restart a running camera once a burst of settings changes settles"""
+        if self.camera_thread and self.camera_thread.isRunning():
+            self._restart_timer.start(self.RESTART_DELAY_MS)
+
+    def _restart_camera(self):
+        """Apply the pending settings by restarting the camera"""
         if self.camera_thread and self.camera_thread.isRunning():
-            # Restart camera with new backend
             self.start_camera()
 
+    def _open_property_capture(self, camera_id: int) -> Optional[cv2.VideoCapture]:
+        """Open a camera with the preferred backend for a property query"""
+        if self.current_backend == CameraBackend.DSHOW:
+            cap = cv2.VideoCapture(camera_id, cv2.CAP_DSHOW)
+        elif self.current_backend == CameraBackend.V4L:
+            cap = cv2.VideoCapture(camera_id, cv2.CAP_V4L)
+        else:
+            cap = cv2.VideoCapture(camera_id)
+
+        if not cap.isOpened():
+            cap.release()
+            return None
+        return cap
+
     def get_camera_properties(self, camera_id: Optional[int] = None) -> Dict[str, Any]:
         """Get detailed properties of a specific camera
         This will temporarily open the camera to query its properties
@@ -815,36 +1189,21 @@ class CameraModel(QObject):
         cap = None
 
         try:
-            # Try to open the camera with the preferred backend
-            if self.current_backend == CameraBackend.DSHOW:
-                cap = cv2.VideoCapture(camera_id, cv2.CAP_DSHOW)
-            elif self.current_backend == CameraBackend.V4L:
-                cap = cv2.VideoCapture(camera_id, cv2.CAP_V4L)
-            else:
-                cap = cv2.VideoCapture(camera_id)
-
-            if not cap.isOpened():
+            cap = self._open_property_capture(camera_id)
+            if cap is None:
                 return {"error": "Failed to open camera"}
 
-            # Collect properties
-            properties["width"] = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            properties["height"] = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            properties["fps"] = cap.get(cv2.CAP_PROP_FPS)
-            properties["format"] = cap.get(cv2.CAP_PROP_FORMAT)
-            properties["mode"] = cap.get(cv2.CAP_PROP_MODE)
-            properties["brightness"] = cap.get(cv2.CAP_PROP_BRIGHTNESS)
-            properties["contrast"] = cap.get(cv2.CAP_PROP_CONTRAST)
-            properties["saturation"] = cap.get(cv2.CAP_PROP_SATURATION)
-            properties["hue"] = cap.get(cv2.CAP_PROP_HUE)
-            properties["gain"] = cap.get(cv2.CAP_PROP_GAIN)
-            properties["exposure"] = cap.get(cv2.CAP_PROP_EXPOSURE)
-
-            # Try to get supported resolutions
+            # Collect properties in one pass
+            properties = {name: cap.get(prop) for name, prop in _CAMERA_PROPS}
+            properties["width"] = int(properties["width"])
+            properties["height"] = int(properties["height"])
+
+            # Try to get supported resolutions, unless the backend can't resize
             supported_resolutions = []
-            for res in [(640, 480), (800, 600), (1280, 720), (1920, 1080)]:
-                if cap.set(cv2.CAP_PROP_FRAME_WIDTH, res[0]) and cap.set(
-                    cv2.CAP_PROP_FRAME_HEIGHT, res[1]
-                ):
+            for res in _PROBE_RESOLUTIONS:
+                if not cap.set(cv2.CAP_PROP_FRAME_WIDTH, res[0]):
+                    break
+                if cap.set(cv2.CAP_PROP_FRAME_HEIGHT, res[1]):
                     actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
                     actual_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
                     if (actual_width, actual_height) == res:
@@ -855,7 +1214,9 @@ class CameraModel(QObject):
         except Exception as e:
             properties["error"] = str(e)
         finally:
-            if cap and cap.isOpened():
+            # Keeping the device open would lock out the capture thread and
+            # other apps, and leave it at the last probed resolution
+            if cap is not None:
                 cap.release()
 
         return properties
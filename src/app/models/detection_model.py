@@ -1,44 +1,226 @@
 import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import cv2
 import numpy as np
 from pathlib import Path
 from ultralytics import YOLO
 import supervision as sv
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from PyQt6.QtCore import QThread, QMutex, QWaitCondition
 from ..utils.model_utils import ModelManager
 import inspect
 import logging
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+PAD_VALUE = 114 / 255  # Ultralytics' letterbox border colour, normalized
+LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX  # Font supervision's LabelAnnotator draws with
+CONFIDENCE_SUFFIX = " 0.00"  # Stand-in for the confidence, Hershey digits share a width
+
+
+if numba is not None:
+
+    # Fused letterbox: bilinear resize, channel swap, /255 and HWC to CHW in one
+    # pass. Channels are swapped the way Ultralytics swaps the arrays it is given
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _letterbox_chw(src, dst, scale, pad_x, pad_y, new_w, new_h):
+        src_h, src_w = src.shape[0], src.shape[1]
+        inv_scale = 1.0 / scale
+        for y in numba.prange(dst.shape[1]):
+            row = y - pad_y
+            if row < 0 or row >= new_h:
+                for x in range(dst.shape[2]):
+                    for c in range(3):
+                        dst[c, y, x] = PAD_VALUE
+                continue
+            sy = min(max((row + 0.5) * inv_scale - 0.5, 0.0), src_h - 1.0)
+            y0 = int(sy)
+            y1 = min(y0 + 1, src_h - 1)
+            fy = sy - y0
+            for x in range(dst.shape[2]):
+                col = x - pad_x
+                if col < 0 or col >= new_w:
+                    for c in range(3):
+                        dst[c, y, x] = PAD_VALUE
+                    continue
+                sx = min(max((col + 0.5) * inv_scale - 0.5, 0.0), src_w - 1.0)
+                x0 = int(sx)
+                x1 = min(x0 + 1, src_w - 1)
+                fx = sx - x0
+                for c in range(3):
+                    k = 2 - c
+                    top = src[y0, x0, k] + fx * (src[y0, x1, k] - src[y0, x0, k])
+                    bottom = src[y1, x0, k] + fx * (src[y1, x1, k] - src[y1, x0, k])
+                    dst[c, y, x] = (top + fy * (bottom - top)) * (1.0 / 255.0)
+
+
+def _box_annotator_supports_labels() -> bool:
+    """Check BoxAnnotator API version - if it accepts labels keyword"""
+    try:
+        sig = inspect.signature(sv.BoxAnnotator.annotate)
+        return "labels" in sig.parameters
+    except (AttributeError, TypeError, ValueError):
+        return True  # Default to older API
+
+
+def _byte_track_method() -> str:
+    """Check ByteTrack API version, from the class so no tracker is built"""
+    tracker_cls = getattr(sv, "ByteTrack", None)
+    if tracker_cls is None:
+        return "update"  # Default to older API
+    for method in ("update_with_detections", "update", "track_objects"):
+        if hasattr(tracker_cls, method):
+            return method
+    return "update_with_detections"  # Default to newer API
+
+
+def _box_polygons(xyxy: np.ndarray) -> np.ndarray:
+    """Corner polygons (N, 4, 2) for int32 (N, 4) boxes, in one fancy-index"""
+    return xyxy[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+
+
+# supervision API differences, checked once per process
+_HAS_COLOR_PALETTE_DEFAULT = hasattr(sv.ColorPalette, "default")
+_BOX_ANNOTATOR_SUPPORTS_LABELS = _box_annotator_supports_labels()
+_BYTE_TRACK_METHOD = _byte_track_method()
+
 
 @dataclass
 class DetectionResult:
     """Container for detection results"""
 
-    frame: np.ndarray
+    frame: Optional[np.ndarray]  # None once the input was annotated in place
     detections: Optional[sv.Detections] = None
-    annotated_frame: Optional[np.ndarray] = None
+    annotation: Optional[Union[np.ndarray, Future]] = None  # Frame or pending draw
     processing_time: float = 0.0
 
+    @property
+    def annotated_frame(self) -> Optional[np.ndarray]:
+        """Annotated frame, waiting for the background draw if it is still running"""
+        if isinstance(self.annotation, Future):
+            self.annotation = self.annotation.result()
+        return self.annotation
+
+
+class CudaGraphForward:
+    """Replays a module's forward pass from captured CUDA graphs, one per input shape"""
+
+    WARMUP_ITERATIONS = 3
+    MAX_GRAPHS = 4  # Captured graphs keep their own memory pool
+
+    def __init__(self, forward):
+        self.forward = forward
+        self.graphs = {}  # shape -> (graph, static_input, static_output)
+        self.last_shape = None
+        self.enabled = True
+
+    def __call__(self, x, *args, **kwargs):
+        # Augmented, visualized or embedding passes don't have fixed outputs
+        if (
+            not self.enabled
+            or args
+            or any(kwargs.values())
+            or not getattr(x, "is_cuda", False)
+        ):
+            return self.forward(x, *args, **kwargs)
+
+        key = (tuple(x.shape), x.dtype)
+        entry = self.graphs.get(key)
+
+        if entry is None:
+            # Only capture once the same shape shows up twice in a row,
+            # so one-off image sizes don't pay the capture cost
+            if key != self.last_shape:
+                self.last_shape = key
+                return self.forward(x)
+            try:
+                entry = self._capture(x)
+            except Exception as e:
+                logging.warning(f"CUDA graph capture failed, running eagerly: {str(e)}")
+                self.graphs.clear()
+                self.enabled = False
+                return self.forward(x)
+
+        graph, static_input, static_output = entry
+        static_input.copy_(x, non_blocking=True)
+        graph.replay()
+        return self._clone_outputs(static_output)
+
+    def _capture(self, x):
+        """Warm up on a side stream, then capture the forward pass for this shape"""
+        import torch
+
+        if len(self.graphs) >= self.MAX_GRAPHS:
+            self.graphs.clear()
+
+        static_input = x.clone()
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(self.WARMUP_ITERATIONS):
+                self.forward(static_input)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_output = self.forward(static_input)
+
+        entry = (graph, static_input, static_output)
+        self.graphs[(tuple(x.shape), x.dtype)] = entry
+        logging.info(f"Captured CUDA graph for input shape {tuple(x.shape)}")
+        return entry
+
+    @classmethod
+    def _clone_outputs(cls, output):
+        """Copy graph outputs so the next replay doesn't overwrite them"""
+        if isinstance(output, (list, tuple)):
+            return type(output)(cls._clone_outputs(o) for o in output)
+        if hasattr(output, "clone"):
+            return output.clone()
+        return output
+
 
 class DetectionModel:
     """Handles YOLO model loading and inference for hazard label detection"""
 
     DEFAULT_CONF_THRESHOLD = 0.25
     DEFAULT_IOU_THRESHOLD = 0.45
+    INPUT_SIZE = 640  # Square letterbox the fused preprocessing writes into
 
-    def __init__(self):
+    def __init__(self, use_fp16: bool = True):
         self.model = None
         self.tracker = None
         self.model_path = None  # Changed: don't set a default model path
         self.conf_threshold = self.DEFAULT_CONF_THRESHOLD
         self.iou_threshold = self.DEFAULT_IOU_THRESHOLD
         self.class_names = []
+        self._class_name_arr = np.empty(0, dtype=object)  # Names indexed by class id
+        self._text_size_cache: Dict[str, Tuple[int, int]] = {}  # Class name -> (w, h)
+        self._suffix_width = 0
+        # Drawing overlaps the next forward pass. One worker keeps draws in order
+        self._draw_pool = ThreadPoolExecutor(max_workers=1)
         self.tracking_enabled = True
         self.annotator = None
         self.available_models = []
         self.box_annotator = None
         self.label_annotator = None
+        self.use_fp16 = use_fp16  # Allow FP16 inference and exported models
+        self.use_half = False
+        self._predict_args = {}  # Per-model predict() settings fixed at load time
+        self._batch_ok = True  # Cleared once the loaded model rejects a batch
+        self._chw = None  # Preallocated (batch, 3, H, W) float32 model input
+        self._chw_tensor = None  # Torch view of _chw, in pinned memory on CUDA
+        self._h2d_stream = None  # Side stream for the pinned host to device copy
+        # Camera, video and image callers share the input buffer, predictor and
+        # tracker, so only one of them runs inference or swaps the model at a time
+        self._infer_lock = threading.Lock()
         self.refresh_available_models()
         self.initialize_annotators()
 
@@ -47,38 +229,10 @@ class DetectionModel:
 
     def _init_supervision_compatibility(self):
         """Initialize compatibility helpers for supervision library API changes"""
-        # Check if ColorPalette has a default() method
-        self.has_color_palette_default = hasattr(sv.ColorPalette, "default")
-
-        # Check BoxAnnotator API version - if it accepts labels keyword
-        try:
-            box_annotator = sv.BoxAnnotator(thickness=2)
-            sig = inspect.signature(box_annotator.annotate)
-            self.box_annotator_supports_labels = "labels" in sig.parameters
-        except:
-            self.box_annotator_supports_labels = True  # Default to older API
-
-        # Check ByteTrack API version
-        if hasattr(sv, "ByteTrack"):
-            try:
-                tracker = sv.ByteTrack()
-                if hasattr(tracker, "update_with_detections"):
-                    self.byte_track_method = "update_with_detections"
-                elif hasattr(tracker, "update"):
-                    self.byte_track_method = "update"
-                elif hasattr(tracker, "track_objects"):
-                    self.byte_track_method = "track_objects"
-                else:
-                    self.byte_track_method = (
-                        "update_with_detections"  # Default to newer API
-                    )
-            except:
-                # Fallback if we couldn't instantiate
-                self.byte_track_method = (
-                    "update_with_detections"  # Default to newer API
-                )
-        else:
-            self.byte_track_method = "update"  # Default to older API
+        # Detected once at import, the installed supervision can't change
+        self.has_color_palette_default = _HAS_COLOR_PALETTE_DEFAULT
+        self.box_annotator_supports_labels = _BOX_ANNOTATOR_SUPPORTS_LABELS
+        self.byte_track_method = _BYTE_TRACK_METHOD
 
     def refresh_available_models(self):
         """Refresh the list of available models"""
@@ -87,6 +241,11 @@ class DetectionModel:
 
     def load_model(self, model_path: Optional[str] = None) -> bool:
         """Load YOLO model from specified path or default path"""
+        with self._infer_lock:
+            return self._load_model(model_path)
+
+    def _load_model(self, model_path: Optional[str] = None) -> bool:
+        """Load a model, called with the inference lock held"""
         try:
             path = model_path if model_path else self.model_path
             if not os.path.exists(path):
@@ -97,6 +256,31 @@ class DetectionModel:
             self.model = YOLO(path)
             self.model_path = path
             self.class_names = self.model.names
+            self._class_name_arr = np.array(
+                [
+                    self.class_names.get(i, "Unknown")
+                    for i in range(max(self.class_names, default=-1) + 1)
+                ],
+                dtype=object,
+            )
+            self._measure_labels()
+
+            # Run inference in FP16 on GPUs with tensor cores
+            self.use_half = self.use_fp16 and self._supports_half()
+
+            # Settle the predictor settings once instead of per call
+            self._predict_args = dict(
+                imgsz=self.INPUT_SIZE,
+                half=self.use_half,
+                device=self._inference_device(path),
+                augment=False,
+                verbose=False,  # Don't format and print speeds for every frame
+            )
+            self._chw = None  # Reallocated for the new device on the next frame
+            self._batch_ok = True
+
+            # Replay the forward pass as a CUDA graph to cut kernel launch overhead
+            self._install_cuda_graph()
 
             # Initialize tracker
             self.tracker = sv.ByteTrack()
@@ -127,6 +311,43 @@ class DetectionModel:
             print(f"Error loading model: {str(e)}")
             return False
 
+    def _supports_half(self) -> bool:
+        """Check if the GPU has tensor cores (compute capability 7.0+) for FP16"""
+        try:
+            import torch
+
+            if not torch.cuda.is_available():
+                return False
+            return torch.cuda.get_device_capability()[0] >= 7
+        except Exception:
+            return False
+
+    def _inference_device(self, path: str):
+        """Pick the device to run on, OpenVINO exports always run on the CPU"""
+        try:
+            import torch
+
+            if torch.cuda.is_available() and not path.endswith("_openvino_model"):
+                return 0
+        except Exception:
+            pass
+        return "cpu"
+
+    def _install_cuda_graph(self):
+        """Wrap the PyTorch module's forward in a CUDA graph runner when on GPU"""
+        try:
+            import torch
+
+            module = getattr(self.model, "model", None)
+            # Exported engines are not nn.Modules and manage their own execution
+            if not torch.cuda.is_available() or not isinstance(
+                module, torch.nn.Module
+            ):
+                return
+            module.forward = CudaGraphForward(module.forward)
+        except Exception as e:
+            logging.warning(f"CUDA graph replay unavailable: {str(e)}")
+
     def _create_default_color_palette(self):
         """Create a default color palette for compatibility with older supervision versions"""
         # Define default colors similar to supervision's default palette
@@ -148,12 +369,112 @@ class DetectionModel:
         # Don't try to create ColorPalette object which might fail
         return colors
 
-    def _format_label(self, detection_index: int, detections: sv.Detections) -> str:
-        """Format detection label with class name and confidence"""
-        class_id = int(detections.class_id[detection_index])
-        confidence = detections.confidence[detection_index]
-        class_name = self.class_names[class_id]
-        return f"{class_name} {confidence:.2f}"
+    def class_names_for(self, class_ids: np.ndarray) -> np.ndarray:
+        """Look up the names of many class ids at once, "Unknown" for ids the model lacks"""
+        ids = np.asarray(class_ids).astype(np.intp)
+        valid = (ids >= 0) & (ids < len(self._class_name_arr))
+        if valid.all():
+            return self._class_name_arr[ids]
+        names = np.full(len(ids), "Unknown", dtype=object)
+        names[valid] = self._class_name_arr[ids[valid]]
+        return names
+
+    def _format_labels(self, detections: sv.Detections) -> List[str]:
+        """Format detection labels with class name and confidence"""
+        # Look every name up with one fancy-index instead of per detection
+        names = self.class_names_for(detections.class_id)
+        return [
+            f"{name} {confidence:.2f}"
+            for name, confidence in zip(names, detections.confidence.tolist())
+        ]
+
+    def _measure_labels(self):
+        """Measure each class name once so labels don't call cv2.getTextSize per box"""
+        scale = getattr(self.label_annotator, "text_scale", 0.5)
+        thickness = getattr(self.label_annotator, "text_thickness", 1)
+        self._text_size_cache = {
+            name: cv2.getTextSize(name, LABEL_FONT, scale, thickness)[0]
+            for name in self._class_name_arr
+        }
+        self._suffix_width = cv2.getTextSize(
+            CONFIDENCE_SUFFIX, LABEL_FONT, scale, thickness
+        )[0][0]
+
+    def _draw_labels(
+        self, scene: np.ndarray, detections: sv.Detections, labels: List[str]
+    ) -> np.ndarray:
+        """Draw labels the way LabelAnnotator does, using the pre-measured text sizes"""
+        annotator = self.label_annotator
+        palette = getattr(annotator, "color", None)
+        if not self._text_size_cache or not hasattr(palette, "by_idx"):
+            return annotator.annotate(scene=scene, detections=detections, labels=labels)
+
+        scale = getattr(annotator, "text_scale", 0.5)
+        thickness = getattr(annotator, "text_thickness", 1)
+        padding = getattr(annotator, "text_padding", 10)
+        text_color = annotator.text_color.as_bgr()
+
+        class_ids = detections.class_id.astype(np.intp)
+        names = self.class_names_for(class_ids)
+        sizes = np.array([self._text_size_cache[name] for name in names], np.int32)
+        x1 = detections.xyxy[:, 0].astype(np.int32)
+        y1 = detections.xyxy[:, 1].astype(np.int32)
+
+        # Fill the backgrounds of each class in one call
+        backgrounds = np.stack(
+            [
+                x1,
+                y1 - sizes[:, 1] - 2 * padding,
+                x1 + sizes[:, 0] + self._suffix_width + 2 * padding,
+                y1,
+            ],
+            axis=1,
+        )
+        self._fill_by_class(scene, backgrounds, class_ids, palette)
+
+        for x, y, label in zip(x1.tolist(), y1.tolist(), labels):
+            cv2.putText(
+                scene,
+                label,
+                (x + padding, y - padding),
+                LABEL_FONT,
+                scale,
+                text_color,
+                thickness,
+                cv2.LINE_AA,
+            )
+        return scene
+
+    def _draw_boxes(self, scene: np.ndarray, detections: sv.Detections) -> np.ndarray:
+        """Draw boxes the way BoxAnnotator does, one polylines call per class"""
+        annotator = self.box_annotator
+        palette = getattr(annotator, "color", None)
+        if not hasattr(palette, "by_idx"):
+            return annotator.annotate(scene=scene, detections=detections)
+
+        thickness = getattr(annotator, "thickness", 2)
+        class_ids = detections.class_id.astype(np.intp)
+        polygons = _box_polygons(detections.xyxy.astype(np.int32))
+        for class_id in np.unique(class_ids).tolist():
+            cv2.polylines(
+                scene,
+                list(polygons[class_ids == class_id]),
+                True,
+                palette.by_idx(class_id).as_bgr(),
+                thickness,
+            )
+        return scene
+
+    @staticmethod
+    def _fill_by_class(scene, xyxy, class_ids, palette):
+        """Fill boxes with their class colour, one fillPoly call per class"""
+        polygons = _box_polygons(xyxy)
+        for class_id in np.unique(class_ids).tolist():
+            cv2.fillPoly(
+                scene,
+                list(polygons[class_ids == class_id]),
+                palette.by_idx(class_id).as_bgr(),
+            )
 
     def initialize_annotators(self):
         """Initialize annotators with consistent styling"""
@@ -166,95 +487,261 @@ class DetectionModel:
             self.box_annotator = None
             self.label_annotator = None
 
-    def detect(self, frame: np.ndarray, is_video: bool = False) -> DetectionResult:
+    def detect(
+        self, frame: np.ndarray, is_video: bool = False, return_original: bool = True
+    ) -> DetectionResult:
         """Run detection on a single frame
         Args:
             frame: Input frame
             is_video: Whether this is part of a video/camera feed (for tracking)
+            return_original: Keep the input untouched, else annotate it in place
         """
+        with self._infer_lock:
+            return self._detect(frame, is_video, return_original)
+
+    def _detect(
+        self, frame: np.ndarray, is_video: bool, return_original: bool
+    ) -> DetectionResult:
+        """Run detection on a single frame, called with the inference lock held"""
         if self.model is None:
             logging.error("No model loaded")
             return DetectionResult(frame=frame)
 
         try:
-            frame_copy = frame.copy()
-            results = self.model(
-                frame_copy, conf=self.conf_threshold, iou=self.iou_threshold
+            # The frame is only read, either by the fused kernel or Ultralytics
+            source, transforms = self._prepare_input([frame])
+            results = self.model.predict(
+                source,
+                conf=self.conf_threshold,
+                iou=self.iou_threshold,
+                **self._predict_args,
             )[0]
+            return self._build_result(
+                frame,
+                results,
+                is_video,
+                transforms[0] if transforms else None,
+                return_original,
+            )
+
+        except Exception as e:
+            logging.error(f"Detection error: {str(e)}", exc_info=True)
+            return DetectionResult(frame=frame)
+
+    def detect_batch(
+        self,
+        frames: List[np.ndarray],
+        is_video: bool = False,
+        return_original: bool = True,
+    ) -> List[DetectionResult]:
+        """Run detection on several frames with a single batched forward pass
+        Args:
+            frames: Input frames, in stream order
+            is_video: Whether these are part of a video/camera feed (for tracking)
+            return_original: Keep the inputs untouched, else annotate them in place
+        """
+        if not frames:
+            return []
+        if len(frames) == 1 or not self._batch_ok:
+            return [self.detect(frame, is_video, return_original) for frame in frames]
+
+        with self._infer_lock:
+            return self._detect_batch(frames, is_video, return_original)
+
+    def _detect_batch(
+        self, frames: List[np.ndarray], is_video: bool, return_original: bool
+    ) -> List[DetectionResult]:
+        """Run a batched forward pass, called with the inference lock held"""
+        if self.model is None:
+            logging.error("No model loaded")
+            return [DetectionResult(frame=frame) for frame in frames]
+
+        try:
+            source, transforms = self._prepare_input(frames)
+            # Stream the per-frame results instead of collecting them all first
+            batch_results = self.model.predict(
+                source,
+                conf=self.conf_threshold,
+                iou=self.iou_threshold,
+                stream=True,
+                **self._predict_args,
+            )
+
+            # Results come back in input order so tracking sees frames in sequence
+            return [
+                self._build_result(
+                    frame,
+                    results,
+                    is_video,
+                    transforms[i] if transforms else None,
+                    return_original,
+                )
+                for i, (frame, results) in enumerate(zip(frames, batch_results))
+            ]
+
+        except Exception as e:
+            # Engines exported for a smaller batch end up here, run frames one by
+            # one from now on instead of failing every batch
+            logging.error(f"Batch detection error: {str(e)}")
+            self._batch_ok = False
+            return [self._detect(frame, is_video, return_original) for frame in frames]
+
+    def _prepare_input(self, frames: List[np.ndarray]):
+        """Letterbox frames straight into the preallocated model input
+        Returns the model source and each frame's (scale, pad_x, pad_y), or the
+        frames unchanged for Ultralytics to preprocess when Numba is missing
+        """
+        if numba is None:
+            return frames, None
+
+        import torch
+
+        size = self.INPUT_SIZE
+        if self._chw is None or self._chw.shape[0] < len(frames):
+            self._allocate_input(len(frames))
+
+        transforms = []
+        for i, frame in enumerate(frames):
+            h, w = frame.shape[:2]
+            scale = min(size / h, size / w)
+            new_w, new_h = round(w * scale), round(h * scale)
+            pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+            _letterbox_chw(frame, self._chw[i], scale, pad_x, pad_y, new_w, new_h)
+            transforms.append((scale, pad_x, pad_y))
+
+        # Tensors skip Ultralytics' own resize, swap and normalize steps
+        batch = self._chw_tensor[: len(frames)]
+        if self._h2d_stream is None:
+            return batch, transforms
+
+        # DMA from pinned memory, the forward pass waits for it on its own stream
+        with torch.cuda.stream(self._h2d_stream):
+            device_batch = batch.to("cuda", non_blocking=True)
+        current = torch.cuda.current_stream()
+        current.wait_stream(self._h2d_stream)
+        device_batch.record_stream(current)
+        return device_batch, transforms
+
+    def _allocate_input(self, batch_size: int):
+        """Allocate the model input, page-locked when it is copied to a GPU"""
+        import torch
+
+        on_gpu = self._predict_args.get("device") == 0
+        self._chw_tensor = torch.empty(
+            (batch_size, 3, self.INPUT_SIZE, self.INPUT_SIZE),
+            dtype=torch.float32,
+            pin_memory=on_gpu,
+        )
+        self._chw = self._chw_tensor.numpy()  # Shared memory the kernel writes into
+        if on_gpu and self._h2d_stream is None:
+            self._h2d_stream = torch.cuda.Stream()
+
+    def _build_result(
+        self,
+        frame: np.ndarray,
+        results,
+        is_video: bool,
+        transform=None,
+        return_original: bool = True,
+    ) -> DetectionResult:
+        """Convert raw YOLO results to tracked, annotated detection results"""
+        # Skip building per-frame log messages when INFO is filtered out
+        log_info = logging.root.isEnabledFor(logging.INFO)
+        if log_info:
             logging.info(f"Detection results: {len(results.boxes)} boxes found")
 
-            # Convert YOLO results to supervision Detections
-            detections = sv.Detections.from_ultralytics(results)
+        # Convert YOLO results to supervision Detections
+        detections = sv.Detections.from_ultralytics(results)
+
+        # Boxes from a letterboxed tensor are in model input coordinates
+        if transform is not None and len(detections) > 0:
+            scale, pad_x, pad_y = transform
+            h, w = frame.shape[:2]
+            xyxy = (detections.xyxy - (pad_x, pad_y, pad_x, pad_y)) / scale
+            np.clip(xyxy[:, 0::2], 0, w, out=xyxy[:, 0::2])
+            np.clip(xyxy[:, 1::2], 0, h, out=xyxy[:, 1::2])
+            detections.xyxy = xyxy
+        if log_info:
             logging.info(
                 f"Converted to supervision detections: {len(detections) if detections else 0} detections"
             )
 
-            # Only apply tracking if this is a video/camera feed
-            if (
-                is_video
-                and self.tracking_enabled
-                and detections
-                and len(detections) > 0
-            ):
-                if self.byte_track_method == "update_with_detections":
-                    detections = self.tracker.update_with_detections(
-                        detections=detections
-                    )
-                    logging.info("Applied tracking with update_with_detections")
-                else:
-                    detections = self.tracker.update(
-                        detections=detections, frame=frame_copy
-                    )
-                    logging.info("Applied tracking with update")
-
-            # Create annotated frame regardless of detections
-            annotated_frame = frame_copy.copy()
+        # Only apply tracking if this is a video/camera feed
+        if (
+            is_video
+            and self.tracking_enabled
+            and detections
+            and len(detections) > 0
+        ):
+            if self.byte_track_method == "update_with_detections":
+                detections = self.tracker.update_with_detections(
+                    detections=detections
+                )
+                logging.info("Applied tracking with update_with_detections")
+            else:
+                detections = self.tracker.update(
+                    detections=detections, frame=frame
+                )
+                logging.info("Applied tracking with update")
+
+        # Create annotated frame regardless of detections. This is the one copy
+        # per frame, taken now since the caller may reuse the frame's buffer.
+        # A caller handing over the frame gets it drawn on in place instead,
+        # as long as OpenCV can draw into it (video frames are channel-reversed views)
+        owned = (
+            not return_original
+            and frame.flags.c_contiguous
+            and frame.flags.writeable
+        )
+        annotated_frame = frame if owned else frame.copy()
+
+        # Always attempt to draw boxes and labels if we have detections
+        annotation = annotated_frame
+        if detections is not None and len(detections) > 0:
+            annotation = self._draw_pool.submit(
+                self._annotate, frame, annotated_frame, detections
+            )
 
-            # Always attempt to draw boxes and labels if we have detections
-            if detections is not None and len(detections) > 0:
-                try:
-                    logging.info(f"Preparing to annotate {len(detections)} detections")
-
-                    # Prepare labels
-                    labels = [
-                        f"{self.class_names[class_id]} {confidence:0.2f}"
-                        for class_id, confidence in zip(
-                            detections.class_id, detections.confidence
-                        )
-                    ]
-                    logging.info(f"Created labels: {labels}")
-
-                    # Draw boxes and labels
-                    if self.box_annotator:
-                        annotated_frame = self.box_annotator.annotate(
-                            scene=annotated_frame, detections=detections
-                        )
-                        logging.info("Applied box annotations")
-
-                    if self.label_annotator:
-                        annotated_frame = self.label_annotator.annotate(
-                            scene=annotated_frame, detections=detections, labels=labels
-                        )
-                        logging.info("Applied label annotations")
-
-                except Exception as annotation_error:
-                    logging.error(f"Annotation error: {str(annotation_error)}")
-                    logging.error(f"Detections data: {detections}")
-                    return DetectionResult(
-                        frame=frame, detections=detections, annotated_frame=frame_copy
-                    )
+        # Always return a result with the annotated frame. No original is kept
+        # once the frame was handed over
+        return DetectionResult(
+            frame=None if owned else frame,
+            detections=detections,
+            annotation=annotation,
+            processing_time=results.speed.get("inference", 0),
+        )
+
+    def _annotate(
+        self, frame: np.ndarray, annotated_frame: np.ndarray, detections: sv.Detections
+    ) -> np.ndarray:
+        """Draw boxes and labels into the result's own copy of the frame"""
+        try:
+            log_info = logging.root.isEnabledFor(logging.INFO)
+            if log_info:
+                logging.info(f"Preparing to annotate {len(detections)} detections")
+
+            # Prepare labels
+            labels = self._format_labels(detections)
+            if log_info:
+                logging.info(f"Created labels: {labels}")
+
+            # Draw boxes and labels
+            if self.box_annotator:
+                annotated_frame = self._draw_boxes(annotated_frame, detections)
+                logging.info("Applied box annotations")
+
+            if self.label_annotator:
+                annotated_frame = self._draw_labels(
+                    annotated_frame, detections, labels
+                )
+                logging.info("Applied label annotations")
 
-            # Always return a result with the annotated frame
-            return DetectionResult(
-                frame=frame,
-                detections=detections,
-                annotated_frame=annotated_frame,
-                processing_time=results.speed.get("inference", 0),
-            )
+            return annotated_frame
 
-        except Exception as e:
-            logging.error(f"Detection error: {str(e)}", exc_info=True)
-            return DetectionResult(frame=frame)
+        except Exception as annotation_error:
+            logging.error(f"Annotation error: {str(annotation_error)}")
+            logging.error(f"Detections data: {detections}")
+            return frame
 
     def set_conf_threshold(self, value: float):
         """Set confidence threshold"""
@@ -269,3 +756,150 @@ class DetectionModel:
         self.tracking_enabled = enabled
         if enabled and self.tracker is None:
             self.tracker = sv.ByteTrack()
+
+
+class DetectionThread(QThread):
+    """Thread for running detection on camera frames to avoid blocking the UI"""
+
+    # Only the newest frames are kept; by default a single latest-frame slot
+    BATCH_SIZE = 1
+    QUEUE_SIZE = ModelManager.ENGINE_BATCH_SIZE
+    COALESCE_WAIT_MS = 8  # Extra wait for a partial batch to fill, under a frame at 30 FPS
+
+    # Frames that barely differ from the last detected one reuse its result
+    GATE_SIZE = (64, 36)
+    STATIC_DIFF_THRESHOLD = 2.0  # Mean absolute difference per channel value
+
+    def __init__(self, detection_model: DetectionModel, batch_size: int = BATCH_SIZE):
+        super().__init__()
+        self.detection_model = detection_model
+        self.batch_size = max(1, min(batch_size, self.QUEUE_SIZE))
+        self._pending = deque(maxlen=self.batch_size)  # Newest frames, oldest dropped
+        self._mutex = QMutex()
+        self._frame_available = QWaitCondition()
+        self.result_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.running = False
+        self._prev_small = None  # Downsampled last detected frame
+        self._prev_result = None
+        self._gate_reset = False  # Set by clear(), handled on the detection thread
+
+    def submit_frame(self, frame: np.ndarray):
+        """Store a frame for detection, replacing the oldest pending frame"""
+        self._mutex.lock()
+        self._pending.append(frame)
+        self._frame_available.wakeOne()
+        self._mutex.unlock()
+
+    def _take_frames(self) -> List[np.ndarray]:
+        """Wait briefly for pending frames and take all of them"""
+        self._mutex.lock()
+        try:
+            if not self._pending:
+                self._frame_available.wait(self._mutex, 100)
+            # The static gate state is only touched on this thread
+            if self._gate_reset:
+                self._gate_reset = False
+                self._prev_small = None
+                self._prev_result = None
+            # Give a partial batch a moment to fill so frames share a forward pass
+            if self._pending and len(self._pending) < self.batch_size:
+                self._frame_available.wait(self._mutex, self.COALESCE_WAIT_MS)
+            frames = list(self._pending)
+            self._pending.clear()
+            return frames
+        finally:
+            self._mutex.unlock()
+
+    def get_result(self) -> Optional[DetectionResult]:
+        """Get the oldest pending detection result, so batched results play in order"""
+        try:
+            return self.result_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def clear(self):
+        """Discard all pending frames and results"""
+        self._mutex.lock()
+        self._pending.clear()
+        self._gate_reset = True
+        self._mutex.unlock()
+
+        while True:
+            try:
+                self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    @staticmethod
+    def _put_latest(q: queue.Queue, item):
+        """Put an item in a bounded queue, evicting the oldest entries when full"""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def run(self):
+        """Thread main loop for running detection"""
+        self.running = True
+        while self.running:
+            frames = self._take_frames()
+            if not frames:
+                continue
+
+            # Only frames whose scene changed go through the model
+            sources = []  # (index into changed frames or -1 for previous, is own)
+            changed_frames = []
+            for frame in frames:
+                small = cv2.resize(frame, self.GATE_SIZE, interpolation=cv2.INTER_AREA)
+                if self._is_static(small):
+                    sources.append((len(changed_frames) - 1, False))
+                else:
+                    self._prev_small = small
+                    changed_frames.append(frame)
+                    sources.append((len(changed_frames) - 1, True))
+
+            try:
+                detected = self.detection_model.detect_batch(
+                    changed_frames, is_video=True
+                )
+            except Exception as e:
+                logging.error(f"Error in detection thread: {str(e)}")
+                detected = [DetectionResult(frame=frame) for frame in changed_frames]
+
+            for frame, (index, is_own) in zip(frames, sources):
+                base = detected[index] if index >= 0 else self._prev_result
+                if is_own:
+                    result = base
+                else:
+                    result = DetectionResult(
+                        frame=frame,
+                        detections=base.detections,
+                        annotation=base.annotation,
+                    )
+                self._put_latest(self.result_queue, result)
+
+            if detected:
+                self._prev_result = detected[-1]
+
+    def _is_static(self, small: np.ndarray) -> bool:
+        """Check if a downsampled frame matches the last detected frame"""
+        if self._prev_small is None or self._prev_result is None:
+            return False
+        if small.shape != self._prev_small.shape:
+            return False
+
+        diff = int(cv2.absdiff(small, self._prev_small).sum())
+        return diff < self.STATIC_DIFF_THRESHOLD * small.size
+
+    def stop(self):
+        """Stop the detection thread"""
+        self.running = False
+        self._mutex.lock()
+        self._frame_available.wakeAll()
+        self._mutex.unlock()
+        self.wait(2000)
@@ -0,0 +1,183 @@
+import os
+import queue
+import logging
+import threading
+from pathlib import Path
+import cv2
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from .detection_model import DetectionModel
+
+logger = logging.getLogger("VideoModel")
+
+
+class VideoWorker(QObject):
+    """Worker that decodes, detects and saves a video off the UI thread"""
+
+    frame_ready = pyqtSignal(np.ndarray, np.ndarray)  # (original, annotated) RGB
+    detections_ready = pyqtSignal(object)  # sv.Detections for the latest frame
+    progress_updated = pyqtSignal(int, int, float)  # (frame, total frames, fps)
+    finished = pyqtSignal(str)  # Output path, empty if stopped or failed
+    error = pyqtSignal(str)
+
+    BATCH_SIZE = 4  # Frames per batched forward pass
+    QUEUE_SIZE = 2 * BATCH_SIZE  # Decoded frames buffered ahead of inference
+
+    def __init__(
+        self,
+        detection_model: DetectionModel,
+        video_path: str,
+        output_dir: Path,
+        stride=1,
+    ):
+        super().__init__()
+        self.detection_model = detection_model
+        self.video_path = video_path
+        self.output_dir = Path(output_dir)  # Created by the controller at startup
+        self.stride = max(1, int(stride))
+        self.stop_event = threading.Event()
+        self.frame_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._writer_buf = None  # Preallocated writer conversion target
+        self._stopped_early = False
+
+    def stop(self):
+        """Ask the decode and inference loops to finish"""
+        self.stop_event.set()
+
+    @pyqtSlot()
+    def run(self):
+        """Decode on a helper thread and run inference on this worker's thread"""
+        cap = cv2.VideoCapture(self.video_path)
+        writer = None
+        output_path = ""
+
+        try:
+            if not cap.isOpened():
+                raise IOError(f"Could not open video {self.video_path}")
+
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+            # Allocate the writer's BGR buffer once for the whole video
+            self._writer_buf = np.empty((height, width, 3), dtype=np.uint8)
+
+            # Set up output video writer
+            name, ext = os.path.splitext(os.path.basename(self.video_path))
+            output_path = str(self.output_dir / f"{name}_prediction{ext}")
+
+            # Lower the output rate so the saved video keeps the source duration
+            writer = cv2.VideoWriter(
+                output_path,
+                cv2.VideoWriter_fourcc(*"mp4v"),
+                max(1, int(fps) / self.stride),
+                (width, height),
+            )
+
+            decoder = threading.Thread(target=self._decode_loop, args=(cap,))
+            decoder.daemon = True
+            decoder.start()
+
+            self._inference_loop(writer, total_frames, fps)
+            decoder.join()
+
+        except Exception as e:
+            logger.error(f"Video processing error: {str(e)}", exc_info=True)
+            self.error.emit(f"Error processing video: {str(e)}")
+            output_path = ""
+        finally:
+            self.stop_event.set()
+            cap.release()
+            if writer is not None:
+                writer.release()
+
+        self.finished.emit("" if self._stopped_early else output_path)
+
+    def _decode_loop(self, cap):
+        """Producer: read sampled frames and queue them as RGB"""
+        frame_index = 0
+        try:
+            while not self.stop_event.is_set():
+                # Skip frames without decoding them, only the sampled one is read
+                for _ in range(self.stride - 1):
+                    if not cap.grab():
+                        break
+                    frame_index += 1
+
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frame_index += 1
+
+                # read() returns a new array per frame, so a channel-reversed
+                # view can cross threads. Detection copies it for annotation
+                if not self._put(frame_index, frame[..., ::-1]):
+                    break
+        finally:
+            self._put(None, None)  # End of stream marker
+
+    def _put(self, frame_index, frame) -> bool:
+        """Block until there is room in the queue or processing was stopped"""
+        while True:
+            try:
+                self.frame_queue.put((frame_index, frame), timeout=0.1)
+                return True
+            except queue.Full:
+                if self.stop_event.is_set():
+                    return False
+
+    def _inference_loop(self, writer, total_frames, fps):
+        """Consumer: detect, save and publish frames in decode order"""
+        batch = []  # (frame_index, frame_rgb) awaiting a batched forward pass
+        while True:
+            try:
+                frame_index, frame_rgb = self.frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self.stop_event.is_set():
+                    self._stopped_early = True
+                    return
+                continue
+
+            if self.stop_event.is_set() and frame_rgb is not None:
+                self._stopped_early = True
+                return
+
+            if frame_rgb is not None:
+                batch.append((frame_index, frame_rgb))
+
+            # Flush a full batch, or the final partial batch at end of stream
+            if batch and (len(batch) == self.BATCH_SIZE or frame_rgb is None):
+                self._process_batch(batch, writer, total_frames, fps)
+                batch = []
+
+            if frame_rgb is None:
+                return
+
+    def _process_batch(self, batch, writer, total_frames, fps):
+        """Run one forward pass over consecutive frames, preserving their order"""
+        # Run detection with tracking enabled
+        results = self.detection_model.detect_batch(
+            [frame_rgb for _, frame_rgb in batch], is_video=True
+        )
+        for (frame_index, _), result in zip(batch, results):
+            self._publish(result, writer)
+            self.progress_updated.emit(frame_index, total_frames, fps)
+
+    def _publish(self, result, writer):
+        """Write the annotated frame and hand the result to the UI"""
+        if result.annotated_frame is None:
+            return
+
+        if (
+            self._writer_buf is None
+            or self._writer_buf.shape != result.annotated_frame.shape
+        ):
+            self._writer_buf = np.empty_like(result.annotated_frame)
+        cv2.cvtColor(
+            result.annotated_frame, cv2.COLOR_RGB2BGR, dst=self._writer_buf
+        )
+        writer.write(self._writer_buf)
+
+        self.frame_ready.emit(result.frame, result.annotated_frame)
+        self.detections_ready.emit(result.detections)
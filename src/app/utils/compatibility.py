@@ -3,13 +3,15 @@ Compatibility utilities for handling different versions of libraries
 """
 
 import logging
+import functools
 import importlib.metadata
 
 logger = logging.getLogger("Compatibility")
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_version(package_name):
-    """Get the installed version of a package"""
+    """Get the installed version of a package, looked up once per process"""
     try:
         return importlib.metadata.version(package_name)
     except importlib.metadata.PackageNotFoundError:
@@ -0,0 +1,63 @@
+"""
+Numba kernels for per-frame pixel work, with NumPy fallbacks
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    # Parallel over rows, a single frame gives guvectorize no loop dimension
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def reverse_channels(src, dst):
+        """Write src into dst with the channel order reversed"""
+        channels = src.shape[2]
+        for y in numba.prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                for c in range(channels):
+                    dst[y, x, c] = src[y, x, channels - 1 - c]
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def scale_area(src, dst):
+        """Resize src into dst, averaging the source pixels under each output
+        pixel like cv2.INTER_AREA. Upscaling repeats the nearest pixel
+        """
+        src_h, src_w, channels = src.shape
+        dst_h, dst_w = dst.shape[0], dst.shape[1]
+        for y in numba.prange(dst_h):
+            y0 = y * src_h // dst_h
+            y1 = max(y0 + 1, (y + 1) * src_h // dst_h)
+            for x in range(dst_w):
+                x0 = x * src_w // dst_w
+                x1 = max(x0 + 1, (x + 1) * src_w // dst_w)
+                count = (y1 - y0) * (x1 - x0)
+                for c in range(channels):
+                    total = 0
+                    for sy in range(y0, y1):
+                        for sx in range(x0, x1):
+                            total += src[sy, sx, c]
+                    dst[y, x, c] = (total + count // 2) // count
+
+else:
+    reverse_channels = None
+    scale_area = None
+
+
+def contiguous_copy(frame: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Copy a frame into a C-contiguous array, reusing out when it fits
+    Channel-reversed views, like RGB views of decoded BGR frames, are
+    swapped back in one parallel pass over the contiguous source
+    """
+    if out is None or out.shape != frame.shape or out.dtype != frame.dtype:
+        out = np.empty(frame.shape, dtype=frame.dtype)
+
+    if reverse_channels is not None and frame.ndim == 3 and frame.strides[2] < 0:
+        reverse_channels(frame[..., ::-1], out)
+    else:
+        np.copyto(out, frame)
+    return out
@@ -1,4 +1,5 @@
 import os
+import importlib.util
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import logging
@@ -12,6 +13,22 @@ class ModelManager:
     DEFAULT_MODEL_DIR = "models"
     CONFIG_FILE = "models/model_config.txt"
     DEFAULT_MODEL = "yolov8n.pt"
+    ENGINE_BATCH_SIZE = 4  # Max frames per batched TensorRT forward pass
+
+    # Directory listings keyed by path, reused while the directory mtime and every
+    # listed file's (mtime, size) are unchanged, so overwritten models show up too
+    _models_cache: Dict[
+        str, Tuple[int, List[Tuple[str, Tuple[int, int]]], List[Tuple[str, str]]]
+    ] = {}
+
+    @staticmethod
+    def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+        """(mtime, size) of a file, None if it can't be read"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     @staticmethod
     def get_available_models(model_dir: Optional[str] = None) -> List[Tuple[str, str]]:
@@ -29,22 +46,162 @@ class ModelManager:
                 logger.info(f"Created models directory: {model_dir}")
                 return models
 
+            # Reuse the last scan if no file was added, removed, renamed or rewritten
+            mtime = os.stat(model_dir).st_mtime_ns
+            cached = ModelManager._models_cache.get(model_dir)
+            if cached and cached[0] == mtime and all(
+                ModelManager._file_stamp(path) == stamp for path, stamp in cached[1]
+            ):
+                return list(cached[2])
+
             # Scan for .pt files
-            for file in os.listdir(model_dir):
-                if file.endswith(".pt"):
-                    file_path = os.path.join(model_dir, file)
-                    # Format display name (remove extension and add size info)
-                    size_mb = os.path.getsize(file_path) / (1024 * 1024)
-                    display_name = f"{file} ({size_mb:.1f} MB)"
-                    models.append((file_path, display_name))
+            stamps = []
+            with os.scandir(model_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pt") and entry.is_file():
+                        # Format display name (remove extension and add size info)
+                        st = entry.stat()
+                        size_mb = st.st_size / (1024 * 1024)
+                        display_name = f"{entry.name} ({size_mb:.1f} MB)"
+                        models.append((entry.path, display_name))
+                        stamps.append((entry.path, (st.st_mtime_ns, st.st_size)))
 
-            models.sort(key=lambda x: x[0])  # Sort by file path
+            models.sort(key=lambda x: x[1].lower())  # Sort by filename
+            ModelManager._models_cache[model_dir] = (mtime, stamps, models)
+            models = list(models)
 
         except Exception as e:
             logger.error(f"Error scanning model directory: {str(e)}")
 
         return models
 
+    @staticmethod
+    def get_engine_path(model_path: str) -> str:
+        """Get the path of the TensorRT engine that sits next to a .pt model"""
+        return os.path.splitext(model_path)[0] + ".engine"
+
+    @staticmethod
+    def get_openvino_path(model_path: str) -> str:
+        """Get the path of the OpenVINO model directory Ultralytics exports next to a .pt model"""
+        return os.path.splitext(model_path)[0] + "_openvino_model"
+
+    @staticmethod
+    def get_export_path(model_path: str) -> Optional[str]:
+        """Get the export path this host would use for a .pt model, if any"""
+        if ModelManager.tensorrt_available():
+            return ModelManager.get_engine_path(model_path)
+        if ModelManager.openvino_available():
+            return ModelManager.get_openvino_path(model_path)
+        return None
+
+    @staticmethod
+    def is_export_current(model_path: str, export_path: str) -> bool:
+        """Check that an export exists and is newer than the checkpoint it came from"""
+        try:
+            return os.stat(export_path).st_mtime_ns >= os.stat(model_path).st_mtime_ns
+        except OSError:
+            return False
+
+    @staticmethod
+    def tensorrt_available() -> bool:
+        """Check whether a CUDA device and TensorRT are available for export"""
+        try:
+            import torch
+
+            if not torch.cuda.is_available():
+                return False
+        except ImportError:
+            return False
+
+        return importlib.util.find_spec("tensorrt") is not None
+
+    @staticmethod
+    def openvino_available() -> bool:
+        """Check whether OpenVINO is installed for CPU exports"""
+        return importlib.util.find_spec("openvino") is not None
+
+    @staticmethod
+    def export_optimized_model(model_path: str) -> Optional[str]:
+        """
+        Export a .pt model for the fastest backend on this host: a TensorRT
+        engine on CUDA GPUs, an OpenVINO model on CPU-only hosts.
+        Returns the export path, or None if no export is possible
+        """
+        if not model_path.endswith(".pt"):
+            return None
+        if ModelManager.tensorrt_available():
+            return ModelManager.export_tensorrt_engine(model_path)
+        if ModelManager.openvino_available():
+            return ModelManager.export_openvino_model(model_path)
+        return None
+
+    @staticmethod
+    def export_tensorrt_engine(model_path: str) -> Optional[str]:
+        """
+        Export a .pt model to a TensorRT FP16 engine, reusing a cached engine
+        if one next to the model is newer than the checkpoint.
+        Returns the engine path, or None if the export is not possible
+        """
+        if not model_path.endswith(".pt"):
+            return None
+
+        engine_path = ModelManager.get_engine_path(model_path)
+        if ModelManager.is_export_current(model_path, engine_path):
+            return engine_path
+
+        if not ModelManager.tensorrt_available():
+            return None
+
+        try:
+            from ultralytics import YOLO
+
+            logger.info(f"Exporting TensorRT engine for {model_path}")
+            exported = YOLO(model_path).export(
+                format="engine",
+                imgsz=640,
+                half=True,
+                dynamic=True,
+                batch=ModelManager.ENGINE_BATCH_SIZE,
+                device=0,
+            )
+            if exported and os.path.exists(exported):
+                return str(exported)
+        except Exception as e:
+            logger.error(f"Error exporting TensorRT engine: {str(e)}")
+
+        return None
+
+    @staticmethod
+    def export_openvino_model(model_path: str) -> Optional[str]:
+        """
+        Export a .pt model to an FP16 OpenVINO model for CPU inference, reusing
+        a cached export if one next to the model is newer than the checkpoint.
+        Returns the export path, or None if the export is not possible
+        """
+        if not model_path.endswith(".pt"):
+            return None
+
+        export_path = ModelManager.get_openvino_path(model_path)
+        if ModelManager.is_export_current(model_path, export_path):
+            return export_path
+
+        if not ModelManager.openvino_available():
+            return None
+
+        try:
+            from ultralytics import YOLO
+
+            logger.info(f"Exporting OpenVINO model for {model_path}")
+            exported = YOLO(model_path).export(
+                format="openvino", imgsz=640, half=True, dynamic=True
+            )
+            if exported and os.path.exists(exported):
+                return str(exported)
+        except Exception as e:
+            logger.error(f"Error exporting OpenVINO model: {str(e)}")
+
+        return None
+
     @staticmethod
     def save_last_model(model_path: str) -> bool:
         """Save the last used model path to config file"""
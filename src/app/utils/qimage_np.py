@@ -0,0 +1,33 @@
+"""
+Zero-copy wrapping of NumPy frames in QImages
+"""
+
+import numpy as np
+from PyQt6.QtGui import QImage
+from .frame_numba import contiguous_copy
+
+# QImage format for each channel count of an 8-bit frame
+_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+
+def ndarray2qimage(arr: np.ndarray):
+    """Wrap an 8-bit grayscale, RGB or RGBA frame in a QImage without copying
+    Rows may be padded, as in ROI views, and are passed on as bytesPerLine.
+    Frames whose pixels aren't packed within a row are copied once.
+    Returns the QImage and the array it aliases, which must outlive it
+    """
+    if arr.dtype != np.uint8:
+        arr = arr.astype(np.uint8)
+
+    channels = 1 if arr.ndim == 2 else arr.shape[2]
+    packed = arr.strides[-1] == 1 and (arr.ndim == 2 or arr.strides[1] == channels)
+    if not packed or arr.strides[0] < 0:
+        arr = contiguous_copy(arr)
+
+    height, width = arr.shape[:2]
+    qimage = QImage(arr.ctypes.data, width, height, arr.strides[0], _FORMATS[channels])
+    return qimage, arr
@@ -7,6 +7,40 @@ from PyQt6.QtWidgets import (
     QTextBrowser,
     QSizePolicy,
 )
+from PyQt6 import sip
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+SIGNATURE_STRIDE = 16  # Pixel step of the sampled grid hashed without xxhash
+
+# Dialogs built once and shown again, so help HTML is only parsed once
+_help_cache = {}  # (parent, title, hash(content)) -> StyledHelpDialog
+_confirm_cache = {}  # (parent, title) -> StyledConfirmDialog
+
+
+def frame_signature(frame):
+    """Cheap content signature of a frame, to skip repainting identical frames
+    Hashes the whole frame with xxhash when it is installed, otherwise a
+    strided grid of pixels, fine enough to catch boxes and labels appearing
+    """
+    if xxhash is not None and frame.flags.c_contiguous:
+        return frame.shape, xxhash.xxh3_64_intdigest(frame)
+    sample = frame[::SIGNATURE_STRIDE, ::SIGNATURE_STRIDE]
+    return frame.shape, hash(sample.tobytes())
+
+
+def pixmap_cache_key(frame, signature, width, height):
+    """QPixmapCache key of a frame scaled to a display size
+    Only a whole-frame hash tells frames apart well enough for the global
+    cache, None is returned when the signature is a sampled grid
+    """
+    if xxhash is None or not frame.flags.c_contiguous:
+        return None
+    shape, digest = signature
+    return f"frame:{'x'.join(map(str, shape))}:{digest}:{width}x{height}"
 
 
 class StyledHelpDialog(QDialog):
@@ -83,14 +117,36 @@ class StyledConfirmDialog(QDialog):
         layout.addLayout(button_layout)
 
 
+def _cached_dialog(cache, key):
+    """Get a cached dialog, unless Qt already deleted it along with its parent"""
+    dialog = cache.get(key)
+    if dialog is not None and sip.isdeleted(dialog):
+        del cache[key]
+        return None
+    return dialog
+
+
 def show_styled_help(parent, title, content, width=600, height=400):
     """Show a styled help dialog"""
-    dialog = StyledHelpDialog(parent, title, content, width, height)
+    key = (parent, title, hash(content))
+    dialog = _cached_dialog(_help_cache, key)
+    if dialog is None:
+        dialog = StyledHelpDialog(parent, title, content, width, height)
+        _help_cache[key] = dialog
+    else:
+        dialog.resize(width, height)
     dialog.exec()
 
 
 def show_styled_confirmation(parent, title, message, width=400, height=150):
     """Show a styled confirmation dialog and return True if confirmed"""
-    dialog = StyledConfirmDialog(parent, title, message, width, height)
+    key = (parent, title)
+    dialog = _cached_dialog(_confirm_cache, key)
+    if dialog is None:
+        dialog = StyledConfirmDialog(parent, title, message, width, height)
+        _confirm_cache[key] = dialog
+    else:
+        dialog.message_label.setText(message)
+        dialog.resize(width, height)
     result = dialog.exec()
     return result == QDialog.DialogCode.Accepted
@@ -6,13 +6,32 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QHBoxLayout,
 )
-from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QPixmap, QPixmapCache
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 import numpy as np
+from ..utils.ui_helpers import frame_signature, pixmap_cache_key
+from ..utils.qimage_np import ndarray2qimage
+from ..utils.frame_numba import contiguous_copy, scale_area
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
 
 class CameraView(QWidget):
-    """Widget for displaying camera feed with detection overlays"""
+    """Widget for displaying camera feed with detection overlays
+
+    Frames that own their memory are kept by reference, producers don't write
+    to them once handed over. Views into buffers that may be reused are copied
+    """
+
+    RESIZE_DEBOUNCE_MS = 30  # Quiet time after the last resize before rescaling
+
+    # Qt enums used per frame, looked up once instead of on every call
+    _NO_CONVERSION = Qt.ImageConversionFlag.NoFormatConversion
+    _KEEP_AR = Qt.AspectRatioMode.KeepAspectRatio
+    _SMOOTH = Qt.TransformationMode.SmoothTransformation
 
     def __init__(self):
         super().__init__()
@@ -70,6 +89,23 @@ class CameraView(QWidget):
         # Track current mode
         self.current_mode = "split"  # or "camera"
 
+        # Last scaled pixmap per label: object name -> (frame, signature, size, pixmap)
+        self._scaled_cache = {}
+
+        # Array each label's QImage was built on, object name -> array. With
+        # OpenCV this is the label's resize target, reused while its size holds
+        self._label_buffers = {}
+
+        # Coalesces a burst of resize events into one rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._refresh_labels)
+
+        # One transparent pixmap shared by every clear(), Qt scales nothing for it
+        self._empty_pixmap = QPixmap(1, 1)
+        self._empty_pixmap.fill(Qt.GlobalColor.transparent)
+
         # Initialize state
         self.clear()
         self.last_frame = None  # Add this attribute
@@ -91,7 +127,9 @@ class CameraView(QWidget):
         if frame is None:
             return
 
-        self.last_frame = frame.copy()  # Store the frame
+        if not frame.flags.owndata:
+            frame = contiguous_copy(frame)
+        self.last_frame = frame  # Store the frame, owned by the view from here on
 
         if self.current_mode == "camera":
             self._update_label(self.camera_label, frame)
@@ -102,7 +140,9 @@ class CameraView(QWidget):
     def show_original_image(self, frame: np.ndarray):
         """Display the original image in split mode"""
         if self.current_mode != "camera" and frame is not None:
-            self.last_original = frame.copy()
+            if not frame.flags.owndata:
+                frame = contiguous_copy(frame)
+            self.last_original = frame
             self._update_label(self.original_label, frame)
             self.original_label.setText("")
             self.predicted_label.setText("Detection results will appear here")
@@ -112,25 +152,93 @@ class CameraView(QWidget):
         if frame is None:
             return
 
-        height, width, channels = frame.shape
-        bytes_per_line = channels * width
-        q_image = QImage(
-            frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888
-        )
-        pixmap = QPixmap.fromImage(q_image)
+        # Nothing to rescale if neither the frame nor the label size changed.
+        # The cache holds the frame itself, so its identity can't be reused.
+        # A different array with the same content is caught by its signature
+        key = label.objectName()
+        size = label.size()
+        cached = self._scaled_cache.get(key)
+        if cached is not None and cached[2] == size:
+            if cached[0] is frame:
+                label.setPixmap(cached[3])
+                return
+            signature = frame_signature(frame)
+            if signature == cached[1]:
+                self._scaled_cache[key] = (frame, signature, size, cached[3])
+                return
+        else:
+            signature = frame_signature(frame)
+        cached_frame = frame
 
-        # Scale pixmap to fit label while maintaining aspect ratio
-        pixmap = pixmap.scaled(
-            label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        # A frame shown before at this size, like a replayed image, is reused
+        cache_key = pixmap_cache_key(frame, signature, size.width(), size.height())
+        pixmap = QPixmapCache.find(cache_key) if cache_key else None
+        if pixmap is not None:
+            self._scaled_cache[key] = (cached_frame, signature, size, pixmap)
+            label.setPixmap(pixmap)
+            return
+
+        # Downscale with OpenCV's SIMD resize, or the numba area kernel
+        # without it, so Qt only handles label sized data
+        target_width, target_height = self._fit_size(frame.shape, size)
+        resized = False
+        if (cv2 is not None or scale_area is not None) and (
+            target_width > 0 and target_height > 0
+        ):
+            shape = (target_height, target_width) + frame.shape[2:]
+            buffer = self._label_buffers.get(key)
+            if buffer is None or buffer.shape != shape or buffer.dtype != frame.dtype:
+                buffer = np.empty(shape, dtype=frame.dtype)
+            if cv2 is not None:
+                frame = cv2.resize(
+                    frame,
+                    (target_width, target_height),
+                    dst=buffer,
+                    interpolation=cv2.INTER_AREA,
+                )
+            else:
+                if frame.ndim == 2:
+                    scale_area(frame[..., None], buffer[..., None])
+                else:
+                    scale_area(frame, buffer)
+                frame = buffer
+            resized = True
+
+        # The QImage aliases this array. Resize output is kept as the label's
+        # buffer for the next frame, a caller's frame is never written into
+        q_image, frame = ndarray2qimage(frame)
+        if resized:
+            self._label_buffers[key] = frame
+        else:
+            self._label_buffers.pop(key, None)
+        # Always go through fromImage, keeping the RGB888 data as is
+        pixmap = QPixmap.fromImage(q_image, self._NO_CONVERSION)
 
+        # Scale pixmap to fit label while maintaining aspect ratio, unless
+        # the frame was already resized above
+        if not resized:
+            pixmap = pixmap.scaled(size, self._KEEP_AR, self._SMOOTH)
+
+        if cache_key:
+            QPixmapCache.insert(cache_key, pixmap)
+        self._scaled_cache[key] = (cached_frame, signature, size, pixmap)
         label.setPixmap(pixmap)
 
+    @staticmethod
+    def _fit_size(shape, size) -> tuple:
+        """Largest (width, height) within a label size that keeps the frame's aspect ratio"""
+        frame_height, frame_width = shape[:2]
+        scale = min(size.width() / frame_width, size.height() / frame_height)
+        return int(frame_width * scale), int(frame_height * scale)
+
     def resizeEvent(self, event):
         """Handle resize for both modes"""
         super().resizeEvent(event)
+        # Rescale once resizing pauses, the labels keep their last pixmap meanwhile
+        self._resize_timer.start()
+
+    def _refresh_labels(self):
+        """Rescale the shown frames to the current label sizes"""
         if self.current_mode == "camera":
             if hasattr(self, "last_frame"):
                 self._update_label(self.camera_label, self.last_frame)
@@ -145,15 +253,14 @@ class CameraView(QWidget):
         self.last_frame = None  # Clear the frame
         self.last_original = None
         self.last_predicted = None
-
-        empty_pixmap = QPixmap(self.camera_label.size())
-        empty_pixmap.fill(Qt.GlobalColor.transparent)
+        self._scaled_cache.clear()
+        self._label_buffers.clear()
 
         if self.current_mode == "camera":
-            self.camera_label.setPixmap(empty_pixmap)
+            self.camera_label.setPixmap(self._empty_pixmap)
             self.camera_label.setText("No Camera Feed")
         else:
-            self.original_label.setPixmap(empty_pixmap)
-            self.predicted_label.setPixmap(empty_pixmap)
+            self.original_label.setPixmap(self._empty_pixmap)
+            self.predicted_label.setPixmap(self._empty_pixmap)
             self.original_label.setText("Original Image")
             self.predicted_label.setText("Detection Results")
@@ -34,6 +34,11 @@ class ControlsPanel(QWidget):
     model_selected = pyqtSignal(str)
     refresh_models_clicked = pyqtSignal()
 
+    # Threshold value and label text for every slider position, built once
+    SLIDER_VALUES = tuple(i / 100.0 for i in range(100))
+    SLIDER_TEXT = tuple(f"{value:.2f}" for value in SLIDER_VALUES)
+    THRESHOLD_EMIT_DELAY_MS = 80  # A slider drag only emits the value it settles on
+
     def __init__(self):
         super().__init__()
         self.layout = QVBoxLayout(self)
@@ -64,6 +69,12 @@ class ControlsPanel(QWidget):
         self.status_timer.timeout.connect(self._update_status_animation)
         self.status_animation_value = 0
 
+        # Coalesce slider drags so the detector is reconfigured once per change
+        self._pending_conf = None
+        self._pending_iou = None
+        self._conf_emit_timer = self._create_emit_timer(self._emit_confidence)
+        self._iou_emit_timer = self._create_emit_timer(self._emit_iou)
+
         # Connect signals
         self._connect_signals()
 
@@ -82,6 +93,8 @@ class ControlsPanel(QWidget):
 
         self.model_selector = QComboBox()
         self.model_selector.setToolTip("Select a YOLO model for detection")
+        self._model_index_by_text = {}  # Display name -> combobox index
+        self._model_index_by_path = {}  # Model path -> combobox index
 
         self.refresh_models_button = QPushButton("↻")
         self.refresh_models_button.setToolTip("Refresh model list")
@@ -230,17 +243,33 @@ class ControlsPanel(QWidget):
         # Reset status
         self.status_label.setText("Disconnected")
 
+    def _create_emit_timer(self, slot):
+        """Create a single-shot timer that delays a threshold emission"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.THRESHOLD_EMIT_DELAY_MS)
+        timer.timeout.connect(slot)
+        return timer
+
     def _on_conf_changed(self, value):
         """Handle confidence slider change"""
-        conf_value = value / 100.0
-        self.conf_label.setText(f"{conf_value:.2f}")
-        self.confidence_changed.emit(conf_value)
+        self.conf_label.setText(self.SLIDER_TEXT[value])
+        self._pending_conf = self.SLIDER_VALUES[value]
+        self._conf_emit_timer.start()
 
     def _on_iou_changed(self, value):
         """Handle IoU slider change"""
-        iou_value = value / 100.0
-        self.iou_label.setText(f"{iou_value:.2f}")
-        self.iou_changed.emit(iou_value)
+        self.iou_label.setText(self.SLIDER_TEXT[value])
+        self._pending_iou = self.SLIDER_VALUES[value]
+        self._iou_emit_timer.start()
+
+    def _emit_confidence(self):
+        """Emit the confidence threshold the slider settled on"""
+        self.confidence_changed.emit(self._pending_conf)
+
+    def _emit_iou(self):
+        """Emit the IoU threshold the slider settled on"""
+        self.iou_changed.emit(self._pending_iou)
 
     def _on_backend_changed(self, index):
         """Handle backend selection change"""
@@ -252,17 +281,27 @@ class ControlsPanel(QWidget):
         self.status_animation_value = (self.status_animation_value + 10) % 100
         self.status_progress.setValue(self.status_animation_value)
 
+    @staticmethod
+    def _fill_combo(combo, items):
+        """Replace a combobox's (text, data) items with one repaint and no signals"""
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            for text, data in items:
+                combo.addItem(text, data)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+
     def set_camera_list(self, camera_infos):
         """Update camera selection combobox with available cameras"""
-        self.camera_panel.camera_selector.clear()
         if not camera_infos:
-            self.camera_panel.camera_selector.addItem("Default Camera (0)", 0)
+            items = [("Default Camera (0)", 0)]
         else:
-            for camera_info in camera_infos:
-                self.camera_panel.camera_selector.addItem(
-                    camera_info.name, camera_info.id
-                )
-        self.camera_panel.camera_selector.addItem("IP/URL Camera", -1)
+            items = [(camera_info.name, camera_info.id) for camera_info in camera_infos]
+        items.append(("IP/URL Camera", -1))
+        self._fill_combo(self.camera_panel.camera_selector, items)
 
     def set_status_message(self, message):
         """Update status message"""
@@ -308,28 +347,33 @@ class ControlsPanel(QWidget):
     def set_model_list(self, models):
         """Update model selection combobox with available models"""
         current_text = self.model_selector.currentText()
-        self.model_selector.clear()
 
+        self._model_index_by_text = {}
+        self._model_index_by_path = {}
         if not models:
-            self.model_selector.addItem("No models found", None)
+            self._fill_combo(self.model_selector, [("No models found", None)])
             self.load_model_button.setEnabled(False)
         else:
-            for file_path, display_name in models:
-                self.model_selector.addItem(display_name, file_path)
+            self._fill_combo(
+                self.model_selector,
+                [(display_name, file_path) for file_path, display_name in models],
+            )
             self.load_model_button.setEnabled(True)
+            for i, (file_path, display_name) in enumerate(models):
+                self._model_index_by_text.setdefault(display_name, i)
+                self._model_index_by_path.setdefault(file_path, i)
 
             # Try to restore previous selection
             if current_text:
-                index = self.model_selector.findText(current_text)
+                index = self._model_index_by_text.get(current_text, -1)
                 if index >= 0:
                     self.model_selector.setCurrentIndex(index)
 
     def set_current_model(self, model_path):
         """Set the current model in the dropdown"""
-        for i in range(self.model_selector.count()):
-            if self.model_selector.itemData(i) == model_path:
-                self.model_selector.setCurrentIndex(i)
-                break
+        index = self._model_index_by_path.get(model_path, -1)
+        if index >= 0:
+            self.model_selector.setCurrentIndex(index)
 
     def set_progress(self, value):
         """Update connection progress"""
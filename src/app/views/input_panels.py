@@ -304,7 +304,7 @@ class VideoInputPanel(QWidget):
     video_selected = pyqtSignal(str)
     playback_started = pyqtSignal(str)  # Emit video path when starting
     playback_stopped = pyqtSignal()
-    frame_processed = pyqtSignal(np.ndarray)  # Emit processed frame
+    stride_changed = pyqtSignal(int)  # Process every Nth frame
 
     def __init__(self):
         super().__init__()
@@ -331,6 +331,16 @@ class VideoInputPanel(QWidget):
         control_layout.addWidget(self.play_btn)
         control_layout.addWidget(self.stop_btn)
 
+        # Frame stride, skipped frames are grabbed but not decoded
+        stride_layout = QFormLayout()
+        self.stride_spin = QSpinBox()
+        self.stride_spin.setRange(1, 30)
+        self.stride_spin.setValue(1)
+        self.stride_spin.setToolTip(
+            "Run detection on every Nth frame; higher values process faster"
+        )
+        stride_layout.addRow("Frame Stride:", self.stride_spin)
+
         # Progress indicator
         self.progress_widget = QWidget()
         progress_layout = QHBoxLayout(self.progress_widget)
@@ -357,6 +367,7 @@ class VideoInputPanel(QWidget):
         controls_layout.addLayout(file_layout)
         controls_layout.addWidget(self.file_label)
         controls_layout.addLayout(control_layout)
+        controls_layout.addLayout(stride_layout)
         controls_layout.addWidget(self.progress_widget)
         controls_layout.addLayout(playlist_layout)
 
@@ -371,6 +382,7 @@ class VideoInputPanel(QWidget):
         self.stop_btn.clicked.connect(self._on_stop)
         self.prev_btn.clicked.connect(self._play_previous)
         self.next_btn.clicked.connect(self._play_next)
+        self.stride_spin.valueChanged.connect(self.stride_changed)
 
         # Store current video path
         self.current_video_path = None
@@ -443,9 +455,8 @@ class VideoInputPanel(QWidget):
         self.stop_btn.setEnabled(True)
         self.file_btn.setEnabled(False)
         self.progress_widget.setVisible(True)
-        # Now start processing and playback
+        # Now start processing and playback, the controller runs it on a worker
         self.playback_started.emit(self.current_video_path)
-        self._process_and_save_video()
 
     def _on_stop(self):
         """Handle stop button click"""
@@ -458,6 +469,27 @@ class VideoInputPanel(QWidget):
         self.progress_bar.setValue(0)
         self.playback_stopped.emit()
 
+    def set_progress(self, frame_count: int, total_frames: int, fps: float):
+        """Update progress bar and time display from the video worker"""
+        self.progress_bar.setRange(0, total_frames)
+        self.progress_bar.setValue(frame_count)
+
+        fps = fps or 30.0
+        current_time = frame_count / fps
+        total_time = total_frames / fps
+        time_str = f"{int(current_time // 60):02d}:{int(current_time % 60):02d} / {int(total_time // 60):02d}:{int(total_time % 60):02d}"
+        self.time_label.setText(time_str)
+
+    def on_processing_finished(self, output_path: str):
+        """Reset controls once the video worker has finished or was stopped"""
+        self.play_btn.setEnabled(self.current_video_path is not None)
+        self.stop_btn.setEnabled(False)
+        self.file_btn.setEnabled(True)
+        self.folder_btn.setEnabled(True)
+
+        if output_path:
+            self.file_label.setText(f"Processing complete | Saved to {output_path}")
+
     def _play_previous(self):
         """Play previous video in playlist"""
         if self.current_video_index > 0:
@@ -477,82 +509,3 @@ class VideoInputPanel(QWidget):
             self.next_btn.setEnabled(
                 self.current_video_index < len(self.video_list) - 1
             )
-
-    def _process_and_save_video(self):
-        output_dir = os.path.join("output", "predictions", "videos")
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Create output video path
-        base_name = os.path.basename(self.current_video_path)
-        name, ext = os.path.splitext(base_name)
-        output_path = os.path.join(output_dir, f"{name}_prediction{ext}")
-
-        # Set up video writer
-        cap = cv2.VideoCapture(self.current_video_path)
-        fps = int(cap.get(cv2.CAP_PROP_FPS))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-
-        try:
-            total_frames_processed = 0
-            error_frames = 0
-            frame_count = 0
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            self.progress_bar.setRange(0, total_frames)
-
-            # Add a flag to check if video should continue processing
-            self.is_processing = True
-
-            while cap.isOpened() and self.is_processing:  # Check flag in loop
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Convert frame to RGB and show original
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                self.frame_processed.emit(frame_rgb)
-
-                # Wait briefly for processing
-                QApplication.processEvents()
-                time.sleep(0.01)  # Small delay to allow processing
-
-                # Update progress
-                frame_count += 1
-                self.progress_bar.setValue(frame_count)
-
-                # Update time display
-                current_time = frame_count / cap.get(cv2.CAP_PROP_FPS)
-                total_time = total_frames / cap.get(cv2.CAP_PROP_FPS)
-                time_str = f"{int(current_time // 60):02d}:{int(current_time % 60):02d} / {int(total_time // 60):02d}:{int(total_time % 60):02d}"
-                self.time_label.setText(time_str)
-
-                if self.play_btn.isEnabled():  # If stop was clicked
-                    self.is_processing = False
-                    break
-
-                QApplication.processEvents()
-
-            # Clean up
-            cap.release()
-            out.release()
-
-            if not self.is_processing:
-                self.file_label.setText("Video processing stopped")
-            else:
-                # Show final summary message only at the end
-                if total_frames_processed > 0:
-                    self.file_label.setText(
-                        f"Processed {total_frames_processed} frames | Saved to {output_path}"
-                    )
-                if error_frames > 0:
-                    self.file_label.setText(
-                        f"Processed {total_frames_processed} frames ({error_frames} errors) | Saved to {output_path}"
-                    )
-
-        except Exception as e:
-            self.file_label.setText(f"Error processing video: {str(e)}")
-        finally:
-            self.is_processing = False
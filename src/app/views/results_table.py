@@ -1,17 +1,87 @@
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLabel,
     QGroupBox,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QColor, QFontMetrics
+from PyQt6.QtCore import Qt, QSize, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QFont, QFontMetrics
 import supervision as sv
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# (track_id, class_name, confidence, position, size)
+DetectionRow = Tuple[str, str, float, str, str]
+
+
+class DetectionTableModel(QAbstractTableModel):
+    """Table model holding one row per displayed detection"""
+
+    HEADERS = ["ID", "Class", "Confidence", "Position", "Size"]
+
+    def __init__(self, row_count: int):
+        super().__init__()
+        self.row_count = row_count
+        self.rows: List[Optional[DetectionRow]] = [None] * row_count
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = self.rows[index.row()] if index.isValid() else None
+        if row is None:
+            return None
+
+        column = index.column()
+        confidence = row[2]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 2:
+                return f"{confidence:.2f}"
+            return row[column]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Center align all items
+            return Qt.AlignmentFlag.AlignCenter
+
+        if column == 2:
+            # Add a special style for high confidence items (> 0.7)
+            if role == Qt.ItemDataRole.ForegroundRole:
+                if confidence > 0.7:
+                    return QColor("#27ae60")  # Success green
+                if confidence < 0.4:
+                    return QColor("#e74c3c")  # Warning red
+            elif role == Qt.ItemDataRole.FontRole and confidence > 0.7:
+                font = QFont()
+                font.setBold(True)  # Make high confidence values bold
+                return font
+
+        return None
+
+    def set_rows(self, rows: List[DetectionRow]):
+        """Replace the displayed rows, only signalling rows that changed"""
+        new_rows = list(rows[: self.row_count])
+        new_rows += [None] * (self.row_count - len(new_rows))
+
+        for i, (old, new) in enumerate(zip(self.rows, new_rows)):
+            if old != new:
+                self.rows[i] = new
+                self.dataChanged.emit(
+                    self.index(i, 0), self.index(i, len(self.HEADERS) - 1)
+                )
 
 
 class ResultsTable(QWidget):
@@ -35,20 +105,17 @@ class ResultsTable(QWidget):
         group_layout.setContentsMargins(8, 12, 8, 8)
         group_layout.setSpacing(8)
 
-        # Create table widget with better styling
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["ID", "Class", "Confidence", "Position", "Size"]
-        )
+        # Set a reasonable row count
+        self.fixed_rows = 8
+
+        # Create table view backed by a model, so updates only touch changed rows
+        self.model = DetectionTableModel(self.fixed_rows)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Disable alternating row colors
         self.table.setAlternatingRowColors(False)
 
-        # Set a reasonable row count
-        self.fixed_rows = 8
-        self.table.setRowCount(self.fixed_rows)
-
         # Set better row heights
         self.table.verticalHeader().setDefaultSectionSize(30)
         self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
@@ -79,7 +146,7 @@ class ResultsTable(QWidget):
         )  # Size
 
         # Enable alternating row colors and row selection
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
         # Add table to layout
         group_layout.addWidget(self.table)
@@ -107,12 +174,8 @@ class ResultsTable(QWidget):
         self, detections: Optional[sv.Detections], class_names: Dict[int, str]
     ):
         """Update table with new detection results"""
-        # Clear all cells but keep rows
-        for row in range(self.fixed_rows):
-            for col in range(5):
-                self.table.setItem(row, col, QTableWidgetItem(""))
-
         if detections is None or len(detections) == 0:
+            self.model.set_rows([])
             self.summary_label.setText("No detections")
             return
 
@@ -121,6 +184,7 @@ class ResultsTable(QWidget):
 
         # Track class counts for summary
         class_counts = {}
+        rows = []
 
         for i in range(display_count):
             # Get detection data
@@ -129,7 +193,9 @@ class ResultsTable(QWidget):
             )
             class_name = class_names.get(class_id, "Unknown")
             confidence = (
-                detections.confidence[i] if detections.confidence is not None else 0.0
+                float(detections.confidence[i])
+                if detections.confidence is not None
+                else 0.0
             )
 
             # Get bounding box
@@ -153,33 +219,9 @@ class ResultsTable(QWidget):
             else:
                 class_counts[class_name] = 1
 
-            # Create table items with improved styling
-            id_item = QTableWidgetItem(track_id)
-            class_item = QTableWidgetItem(class_name)
-            conf_item = QTableWidgetItem(f"{confidence:.2f}")
-            pos_item = QTableWidgetItem(position)
-            size_item = QTableWidgetItem(size)
-
-            # Center align all items
-            for item in [id_item, class_item, conf_item, pos_item, size_item]:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Add a special style for high confidence items (> 0.7)
-            if confidence > 0.7:
-                conf_item.setForeground(QColor("#27ae60"))  # Success green
-                # Fix the font issue - don't try to get font from QFontMetrics
-                font = conf_item.font()
-                font.setBold(True)  # Make high confidence values bold
-                conf_item.setFont(font)
-            elif confidence < 0.4:
-                conf_item.setForeground(QColor("#e74c3c"))  # Warning red
+            rows.append((track_id, class_name, confidence, position, size))
 
-            # Set row items
-            self.table.setItem(i, 0, id_item)
-            self.table.setItem(i, 1, class_item)
-            self.table.setItem(i, 2, conf_item)
-            self.table.setItem(i, 3, pos_item)
-            self.table.setItem(i, 4, size_item)
+        self.model.set_rows(rows)
 
         # Create a simple text summary with very short class names to prevent layout issues
         summary_text = f"Total: {len(detections)} detection"
@@ -224,11 +266,13 @@ class ResultsTable(QWidget):
 
         self.summary_label.setText(summary_text)
 
+    def get_rows(self) -> List[DetectionRow]:
+        """Get the detection rows currently shown in the table"""
+        return [row for row in self.model.rows if row is not None]
+
     def clear(self):
         """Clear the results table"""
-        for row in range(self.fixed_rows):
-            for col in range(5):
-                self.table.setItem(row, col, QTableWidgetItem(""))
+        self.model.set_rows([])
         self.summary_label.setText("No detections")
 
     # Modify size methods to allow vertical expansion
@@ -10,11 +10,89 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QFrame,
 )
-from PyQt6.QtGui import QImage, QPixmap, QIcon
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QRunnable, QThreadPool
 import numpy as np
 import cv2
 import os
+from ..utils.ui_helpers import frame_signature, pixmap_cache_key
+from ..utils.frame_numba import contiguous_copy
+from ..utils.qimage_np import ndarray2qimage
+
+
+class FrameScaleTask(QRunnable):
+    """Fits a frame to a display size and wraps it in a QImage on the thread pool"""
+
+    def __init__(self, request, frame, size, preview_bufs, callback):
+        super().__init__()
+        self.request = request  # Handed back untouched to identify the result
+        self.frame = frame
+        self.size = size
+        self.preview_bufs = preview_bufs
+        self.callback = callback
+
+    def run(self):
+        """Convert, resize and wrap the frame, then report the QImage"""
+        qimage, pixels = None, None
+        try:
+            qimage, pixels = self._scale()
+        except Exception as e:
+            logging.error(f"Error scaling frame: {str(e)}")
+        # The QImage aliases pixels, so they travel together
+        self.callback(self.request, qimage, pixels)
+
+    def _scale(self):
+        """Fit the frame to the display while preserving its aspect ratio"""
+        frame = self.frame
+        key = self.request[0]
+
+        # Ensure correct color format
+        if len(frame.shape) == 2:  # Grayscale
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+        elif frame.shape[2] == 4:  # RGBA
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGBA2RGB)
+
+        # Get dimensions
+        display_width, display_height = self.size
+        frame_height, frame_width = frame.shape[:2]
+
+        # Calculate aspect ratios
+        display_ratio = display_width / display_height
+        frame_ratio = frame_width / frame_height
+
+        # Calculate new dimensions to fit display while preserving aspect ratio
+        if frame_ratio > display_ratio:
+            # Frame is wider than display
+            new_width = display_width
+            new_height = int(new_width / frame_ratio)
+        else:
+            # Frame is taller than display
+            new_height = display_height
+            new_width = int(new_height * frame_ratio)
+
+        if (new_width, new_height) == (frame_width, frame_height) and frame.flags[
+            "C_CONTIGUOUS"
+        ]:
+            # Already display sized, wrap the frame's own memory in the QImage
+            resized_frame = frame
+        else:
+            # Resize frame into this display's preview buffer. A display has one
+            # task in flight at a time, and its pixmap is copied out before the
+            # next one starts, so the buffer is never written while in use
+            preview_shape = (new_height, new_width, frame.shape[2])
+            preview_buf = self.preview_bufs.get(key)
+            if preview_buf is None or preview_buf.shape != preview_shape:
+                preview_buf = np.empty(preview_shape, dtype=np.uint8)
+                self.preview_bufs[key] = preview_buf
+            resized_frame = cv2.resize(
+                frame,
+                (new_width, new_height),
+                dst=preview_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+
+        # Convert to QImage
+        return ndarray2qimage(resized_frame)
 
 
 class UnifiedDisplayView(QWidget):
@@ -23,6 +101,12 @@ class UnifiedDisplayView(QWidget):
     view_toggled = pyqtSignal(bool)  # True for processed view, False for original
     capture_requested = pyqtSignal()  # Request to capture current frame
     save_requested = pyqtSignal()  # Request to save current view
+    display_resized = pyqtSignal(int, int)  # New camera display size
+    frame_scaled = pyqtSignal(object, object, object)  # (request, QImage, pixels)
+
+    RESIZE_DEBOUNCE_MS = 30  # Quiet time after the last resize before refitting
+
+    _NO_CONVERSION = Qt.ImageConversionFlag.NoFormatConversion  # Looked up once
 
     def __init__(self):
         super().__init__()
@@ -109,6 +193,25 @@ class UnifiedDisplayView(QWidget):
         self.processed_frame = None
         self.last_frame = None
 
+        # Preview buffers per display label, reused while the label size is unchanged
+        self._preview_bufs = {}
+
+        # Last pixmap per display label: id(display) -> (frame, signature, size, pixmap)
+        self._pixmap_cache = {}
+
+        # Frames are scaled on the thread pool, one task per display at a time.
+        # A newer frame for a busy display replaces the one waiting behind it
+        self._scale_busy = set()  # id(display) with a task in flight
+        self._scale_pending = {}  # id(display) -> (display, frame, signature, size)
+        self._scale_generation = 0  # Bumped by clear() to drop in-flight results
+        self.frame_scaled.connect(self._on_frame_scaled)
+
+        # Coalesces a burst of resize events into one refit
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._refit_frames)
+
         # Flag for whether we're showing original or processed in camera mode
         self.showing_processed = False
 
@@ -190,8 +293,10 @@ class UnifiedDisplayView(QWidget):
         if frame is None:
             return
 
-        # Store frame copy
-        frame_copy = frame.copy()
+        # Keep arrays that own their memory as given, producers don't write to a
+        # frame once it is handed over. Views into buffers that may be reused
+        # are copied
+        frame_copy = frame if frame.flags.owndata else contiguous_copy(frame)
 
         # Update resolution status
         height, width = frame_copy.shape[:2]
@@ -226,54 +331,71 @@ class UnifiedDisplayView(QWidget):
         if frame is None:
             return
 
-        # Ensure correct color format
-        if len(frame.shape) == 2:  # Grayscale
-            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
-        elif frame.shape[2] == 4:  # RGBA
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGBA2RGB)
-
-        # Get dimensions
-        display_width = display.width()
-        display_height = display.height()
-        frame_height, frame_width = frame.shape[:2]
+        # Nothing to redo if neither the frame nor the display size changed.
+        # The cache holds the frame itself, so its identity can't be reused.
+        # A different array with the same content, as from a static scene,
+        # is caught by its signature
+        size = (display.width(), display.height())
+        cached = self._pixmap_cache.get(id(display))
+        if cached is not None and cached[2] == size:
+            if cached[0] is frame:
+                display.setPixmap(cached[3])
+                return
+            signature = frame_signature(frame)
+            if signature == cached[1]:
+                self._pixmap_cache[id(display)] = (frame, signature, size, cached[3])
+                return
+        else:
+            signature = frame_signature(frame)
 
         # Skip if display has no size yet
-        if display_width <= 1 or display_height <= 1:
+        if size[0] <= 1 or size[1] <= 1:
             return
 
-        # Calculate aspect ratios
-        display_ratio = display_width / display_height
-        frame_ratio = frame_width / frame_height
-
-        # Calculate new dimensions to fit display while preserving aspect ratio
-        if frame_ratio > display_ratio:
-            # Frame is wider than display
-            new_width = display_width
-            new_height = int(new_width / frame_ratio)
-        else:
-            # Frame is taller than display
-            new_height = display_height
-            new_width = int(new_height * frame_ratio)
-
-        # Resize frame
-        resized_frame = cv2.resize(
-            frame, (new_width, new_height), interpolation=cv2.INTER_AREA
-        )
+        # A frame shown before at this size, like a replayed image, is reused
+        cache_key = pixmap_cache_key(frame, signature, *size)
+        pixmap = QPixmapCache.find(cache_key) if cache_key else None
+        if pixmap is not None:
+            self._pixmap_cache[id(display)] = (frame, signature, size, pixmap)
+            display.setPixmap(pixmap)
+            return
 
-        # Convert to QImage
-        height, width, channel = resized_frame.shape
-        bytes_per_line = channel * width
-        qimage = QImage(
-            resized_frame.data,
-            width,
-            height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
+        # Only the newest frame waits behind a display's running task
+        key = id(display)
+        if key in self._scale_busy:
+            self._scale_pending[key] = (display, frame, signature, size)
+            return
+        self._start_scale(display, frame, signature, size)
+
+    def _start_scale(self, display, frame, signature, size):
+        """Hand a frame to the thread pool to be fitted to its display"""
+        key = id(display)
+        self._scale_busy.add(key)
+        request = (key, display, frame, signature, size, self._scale_generation)
+        QThreadPool.globalInstance().start(
+            FrameScaleTask(
+                request, frame, size, self._preview_bufs, self.frame_scaled.emit
+            )
         )
 
-        # Create pixmap and set to display
-        pixmap = QPixmap.fromImage(qimage)
-        display.setPixmap(pixmap)
+    def _on_frame_scaled(self, request, qimage, pixels):
+        """Show a scaled frame on the GUI thread, then start the next waiting one"""
+        key, display, frame, signature, size, generation = request
+        self._scale_busy.discard(key)
+
+        if qimage is not None and generation == self._scale_generation:
+            # Create pixmap and set to display. Always go through fromImage, and
+            # keep the RGB888 data as is rather than converting it to another format
+            pixmap = QPixmap.fromImage(qimage, self._NO_CONVERSION)
+            cache_key = pixmap_cache_key(frame, signature, *size)
+            if cache_key:
+                QPixmapCache.insert(cache_key, pixmap)
+            self._pixmap_cache[key] = (frame, signature, size, pixmap)
+            display.setPixmap(pixmap)
+
+        pending = self._scale_pending.pop(key, None)
+        if pending is not None:
+            self._start_scale(*pending)
 
     def clear(self):
         """Clear all displays"""
@@ -288,6 +410,9 @@ class UnifiedDisplayView(QWidget):
         self.original_frame = None
         self.processed_frame = None
         self.last_frame = None
+        self._pixmap_cache.clear()
+        self._scale_pending.clear()
+        self._scale_generation += 1  # Results still in flight are not shown
 
         self.resolution_label.setText("Resolution: N/A")
         self.detection_count_label.setText("Detections: 0")
@@ -364,6 +489,21 @@ class UnifiedDisplayView(QWidget):
         """Handle widget resize"""
         super().resizeEvent(event)
 
+        # Refit once resizing pauses, the displays keep their last pixmap meanwhile
+        self._resize_timer.start()
+
+        # Set splitter sizes
+        if self.current_mode == "split":
+            self.splitter.setSizes([self.width() // 2, self.width() // 2])
+
+    def _refit_frames(self):
+        """Fit the shown frames to the settled display size"""
+        # Preview sizes change with the widget, drop the old buffers
+        self._preview_bufs.clear()
+        self.display_resized.emit(
+            self.camera_display.width(), self.camera_display.height()
+        )
+
         # Update frames to fit new size
         if self.current_mode == "camera":
             if self.showing_processed and self.processed_frame is not None:
@@ -375,7 +515,3 @@ class UnifiedDisplayView(QWidget):
                 self._show_frame(self.original_display, self.original_frame)
             if self.processed_frame is not None:
                 self._show_frame(self.prediction_display, self.processed_frame)
-
-        # Set splitter sizes
-        if self.current_mode == "split":
-            self.splitter.setSizes([self.width() // 2, self.width() // 2])